@@ -0,0 +1,31 @@
+import argparse
+import timeit
+
+from fasttrack.auth.jwt import (
+    _verify_token,
+    create_access_token,
+    decode_token,
+    verified_token_cache,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare cached and uncached JWT decoding")
+    parser.add_argument("-n", "--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    token = create_access_token(1, "user")
+    verified_token_cache.clear()
+    decode_token(token)
+
+    uncached = timeit.timeit(lambda: _verify_token(token), number=args.number)
+    cached = timeit.timeit(lambda: decode_token(token), number=args.number)
+
+    print(f"uncached decode: {uncached / args.number * 1e6:8.2f} us/call")
+    print(f"cached decode:   {cached / args.number * 1e6:8.2f} us/call")
+    print(f"speedup:         {uncached / cached:8.1f}x")
+    print(f"cache stats:     {verified_token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import math
+import os
+import time
+
+# Keep the limiter in the measured path without it ever rejecting.
+os.environ.setdefault("RATE_LIMIT_REQUESTS", "1000000000")
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from fasttrack.config import get_settings  # noqa: E402
+from fasttrack.main import create_app  # noqa: E402
+from fasttrack.middleware.ratelimit import GCRALimiter, RateLimitMiddleware  # noqa: E402
+
+
+class BaseHTTPRateLimit(BaseHTTPMiddleware):
+    # The previous shape of RateLimitMiddleware, with the same limiter inside.
+    def __init__(self, app, **kwargs) -> None:  # noqa: ANN001, ANN003
+        super().__init__(app, **kwargs)
+        settings = get_settings()
+        self.limiter = GCRALimiter(settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_WINDOW)
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path in ("/docs", "/redoc", "/openapi.json", "/health", "/metrics"):
+            return await call_next(request)
+        client = request.client
+        wait = self.limiter.acquire(f"ip:{client.host}" if client else "ip:unknown")
+        if wait > 0:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
+            )
+        return await call_next(request)
+
+
+def build(legacy: bool) -> FastAPI:
+    app = create_app()
+    if legacy:
+        app.user_middleware = [
+            Middleware(BaseHTTPRateLimit) if m.cls is RateLimitMiddleware else m
+            for m in app.user_middleware
+        ]
+    return app
+
+
+async def drive(app: FastAPI, path: str, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("10.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput of the create_app() middleware stack")
+    parser.add_argument("-n", "--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    # /health is exempt; the unrouted path goes through the limiter and ends in a cheap 404.
+    for path in ("/health", "/api/v1/missing"):
+        results = {}
+        for name, legacy in (("BaseHTTPMiddleware", True), ("pure ASGI", False)):
+            app = build(legacy)
+            await drive(app, path, 500)
+            results[name] = args.requests / await drive(app, path, args.requests)
+            print(f"{path:18} {name:20} {results[name]:9.0f} req/s")
+        gain = results["pure ASGI"] / results["BaseHTTPMiddleware"]
+        print(f"{path:18} {'speedup':20} {gain:9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from fasttrack.middleware.ratelimit import GCRALimiter, LimiterBackend, SQLiteLimiter
+
+
+class SlidingLog:
+    # The previous implementation: a timestamp list per key, rebuilt on every request.
+    def __init__(self, max_requests: int, window: float) -> None:
+        self.max_requests = max_requests
+        self.window = window
+        self._timestamps: dict[str, list[float]] = {}
+
+    def acquire(self, key: str, now: float) -> float:
+        cutoff = now - self.window
+        timestamps = [t for t in self._timestamps.get(key, []) if t > cutoff]
+        self._timestamps[key] = timestamps
+        if len(timestamps) >= self.max_requests:
+            return self.window - (now - timestamps[0])
+        timestamps.append(now)
+        return 0.0
+
+
+def run(limiter: SlidingLog | LimiterBackend, keys: list[str], requests: int) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    # Simulated clock: every request advances it by 100us.
+    for i in range(requests):
+        limiter.acquire(keys[i % len(keys)], 1000.0 + i * 1e-4)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare rate limiter algorithms")
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--window", type=float, default=60.0)
+    args = parser.parse_args()
+
+    keys = [f"ip:10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.clients)]
+    random.Random(0).shuffle(keys)
+    print(f"{args.clients} clients, {args.requests} requests, {args.limit}/{args.window:g}s")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "limits.db")
+        for name, limiter in (
+            ("sliding log", SlidingLog(args.limit, args.window)),
+            ("gcra", GCRALimiter(args.limit, args.window)),
+            # Shared across workers; its state lives in the file, not the Python heap.
+            ("gcra sqlite", SQLiteLimiter(path, args.limit, args.window)),
+        ):
+            elapsed, peak = run(limiter, keys, args.requests)
+            print(
+                f"{name:12} {elapsed / args.requests * 1e6:6.2f} us/request"
+                f"  peak {peak / 2**20:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
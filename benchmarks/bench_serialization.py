@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from fasttrack.main import create_app
+from fasttrack.models.task import Task, TaskPriority
+from fasttrack.schemas.pagination import PaginatedResponse
+from fasttrack.schemas.task import TaskRead
+from fasttrack.utils.serialization import render_page
+
+PAGE_SIZES = (20, 100, 500)
+
+
+def make_page(size: int) -> PaginatedResponse:
+    now = datetime(2026, 1, 1)
+    tasks = [
+        Task(
+            id=i,
+            title=f"Task {i}",
+            description="Lorem ipsum dolor sit amet " * 4,
+            priority=TaskPriority.HIGH,
+            project_id=1,
+            assignee_id=i % 7 or None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(1, size + 1)
+    ]
+    return PaginatedResponse(items=tasks, next_cursor="x" * 40, has_more=True)
+
+
+async def fastapi_default(route: APIRoute, page: PaginatedResponse) -> bytes:
+    # What FastAPI does for a handler returning the page: validate against
+    # response_model, encode to jsonable data, then json.dumps it.
+    content = await serialize_response(field=route.response_field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def timed(fn, number: int) -> float:  # noqa: ANN001
+    start = time.perf_counter()
+    for _ in range(number):
+        await fn()
+    return (time.perf_counter() - start) / number
+
+
+async def run(number: int) -> None:
+    route = next(
+        r for r in create_app().routes if isinstance(r, APIRoute) and r.name == "list_tasks"
+    )
+    print(f"{'page':>6} {'default':>12} {'fast':>12} {'speedup':>8}")
+    for size in PAGE_SIZES:
+        page = make_page(size)
+
+        async def fast(page: PaginatedResponse = page) -> bytes:
+            return render_page(page, TaskRead).body
+
+        default = await timed(lambda page=page: fastapi_default(route, page), number)
+        optimized = await timed(fast, number)
+        print(
+            f"{size:>6} {default * 1e3:>10.3f}ms {optimized * 1e3:>10.3f}ms "
+            f"{default / optimized:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare list response serialization paths")
+    parser.add_argument("-n", "--number", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,9 @@ from alembic import context
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel
 
+from fasttrack.auth.blocklist import BlockedToken  # noqa: F401
 from fasttrack.config import get_settings
-from fasttrack.models import Comment, Project, Task, User  # noqa: F401
+from fasttrack.models import Comment, Counter, Project, Task, User  # noqa: F401
 
 config = context.config
 if config.config_file_name is not None:
@@ -0,0 +1,24 @@
+"""add users.tokens_valid_after
+
+Revision ID: 3f9c1b7d2a64
+Revises: 058c3956fb77
+Create Date: 2026-10-16 09:12:41.518230
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '3f9c1b7d2a64'
+down_revision: str | None = '058c3956fb77'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('tokens_valid_after', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('tokens_valid_after')
@@ -0,0 +1,29 @@
+"""blocked_tokens autoincrement
+
+Revision ID: b8e41f7c3d26
+Revises: f3a6c8d1e2b4
+Create Date: 2026-10-17 09:12:05.418733
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = 'b8e41f7c3d26'
+down_revision: str | None = 'f3a6c8d1e2b4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Revocation sync reads id > last_id, so purged ids must never be handed out again.
+    with op.batch_alter_table(
+        'blocked_tokens', recreate='always', table_kwargs={'sqlite_autoincrement': True}
+    ):
+        pass
+
+
+def downgrade() -> None:
+    with op.batch_alter_table(
+        'blocked_tokens', recreate='always', table_kwargs={'sqlite_autoincrement': False}
+    ):
+        pass
@@ -0,0 +1,27 @@
+"""add task updated_at keyset index
+
+Revision ID: c5d82e1f4a90
+Revises: a71e4c0d9b58
+Create Date: 2026-10-16 11:42:08.517362
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = 'c5d82e1f4a90'
+down_revision: str | None = 'a71e4c0d9b58'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_project_id_updated_at_id',
+        'tasks',
+        ['project_id', 'updated_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_project_id_updated_at_id', table_name='tasks')
@@ -0,0 +1,37 @@
+"""add counters
+
+Revision ID: e2b7a9c31f05
+Revises: c5d82e1f4a90
+Create Date: 2026-10-16 13:05:52.310477
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = 'e2b7a9c31f05'
+down_revision: str | None = 'c5d82e1f4a90'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('counters',
+    sa.Column('scope', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=False),
+    sa.Column('scope_id', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('scope', 'scope_id')
+    )
+    op.execute(
+        "INSERT INTO counters (scope, scope_id, value) "
+        "SELECT 'project_tasks', project_id, count(*) FROM tasks GROUP BY project_id"
+    )
+    op.execute(
+        "INSERT INTO counters (scope, scope_id, value) "
+        "SELECT 'task_comments', task_id, count(*) FROM comments GROUP BY task_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('counters')
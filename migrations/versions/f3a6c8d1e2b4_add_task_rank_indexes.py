@@ -0,0 +1,45 @@
+"""add task priority and status rank indexes
+
+Revision ID: f3a6c8d1e2b4
+Revises: e2b7a9c31f05
+Create Date: 2026-10-16 15:20:41.093217
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = 'f3a6c8d1e2b4'
+down_revision: str | None = 'e2b7a9c31f05'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match fasttrack.models.task.enum_rank exactly, or SQLite will not use the index.
+PRIORITY_RANK = (
+    "CASE WHEN (priority = 'LOW') THEN 0 WHEN (priority = 'MEDIUM') THEN 1 "
+    "WHEN (priority = 'HIGH') THEN 2 END"
+)
+STATUS_RANK = (
+    "CASE WHEN (status = 'TODO') THEN 0 WHEN (status = 'IN_PROGRESS') THEN 1 "
+    "WHEN (status = 'DONE') THEN 2 END"
+)
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tasks_project_id_priority_rank_id',
+        'tasks',
+        ['project_id', sa.text(PRIORITY_RANK), 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_tasks_project_id_status_rank_id',
+        'tasks',
+        ['project_id', sa.text(STATUS_RANK), 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_project_id_status_rank_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_priority_rank_id', table_name='tasks')
@@ -0,0 +1,194 @@
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, exists, or_, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import delete, update
+
+from fasttrack.models.comment import Comment
+from fasttrack.models.project import Project
+from fasttrack.models.task import Task
+from fasttrack.models.user import User, UserRole
+from fasttrack.queries import (
+    PROJECT_STAMP,
+    PROJECT_WITH_VERSION,
+    TASK_STAMP_WITH_OWNER,
+    TASK_WITH_OWNER_AND_VERSION,
+)
+from fasttrack.utils.counters import (
+    OWNER_VERSION,
+    PROJECT_ROW_VERSION,
+    PROJECT_TASKS,
+    PROJECT_VERSION,
+    TASK_COMMENTS,
+    TASK_ROW_VERSION,
+    TASK_VERSION,
+    adjust_counter,
+    bump_version,
+    drop_counter,
+)
+from fasttrack.utils.entity_cache import entity_cache
+from fasttrack.utils.etag import precondition_failed
+
+
+def _project_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
+
+def _task_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+
+def _not_project_owner() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
+
+
+def can_access_task(user: User, owner_id: int, assignee_id: int | None) -> bool:
+    return user.role == UserRole.ADMIN or user.id in (owner_id, assignee_id)
+
+
+def task_access_clause(user: User, *, owner_only: bool = False) -> ColumnElement[bool]:
+    if user.role == UserRole.ADMIN:
+        return true()
+    owned = exists().where(Project.id == Task.project_id, Project.owner_id == user.id)
+    if owner_only:
+        return owned
+    return or_(Task.assignee_id == user.id, owned)
+
+
+async def _load_project(
+    session: AsyncSession, project_id: int
+) -> tuple[Project, None, int] | None:
+    row = (await session.execute(PROJECT_WITH_VERSION, {"project_id": project_id})).first()
+    return None if row is None else (row[0], None, row[1])
+
+
+async def get_project_for_owner(session: AsyncSession, project_id: int, user: User) -> Project:
+    loaded = await entity_cache.load(
+        session, Project, project_id, lambda: _load_project(session, project_id)
+    )
+    if loaded is None:
+        raise _project_not_found()
+    project, _ = loaded
+    if project.owner_id != user.id and user.role != UserRole.ADMIN:
+        raise _not_project_owner()
+    return project
+
+
+async def project_stamp_for_owner(
+    session: AsyncSession, project_id: int, user: User
+) -> datetime:
+    row = (await session.execute(PROJECT_STAMP, {"project_id": project_id})).first()
+    if row is None:
+        raise _project_not_found()
+    updated_at, owner_id = row
+    if owner_id != user.id and user.role != UserRole.ADMIN:
+        raise _not_project_owner()
+    return updated_at
+
+
+async def update_project_for_owner(
+    session: AsyncSession,
+    project_id: int,
+    user: User,
+    values: dict[str, Any],
+    expected_updated_at: datetime | None = None,
+) -> Project:
+    statement = update(Project).where(Project.id == project_id)  # type: ignore[arg-type]
+    if user.role != UserRole.ADMIN:
+        statement = statement.where(Project.owner_id == user.id)  # type: ignore[arg-type]
+    if expected_updated_at is not None:
+        statement = statement.where(Project.updated_at == expected_updated_at)  # type: ignore[arg-type]
+    result = await session.execute(statement.values(**values).returning(Project))
+    project = result.scalar_one_or_none()
+    if project is None:
+        await get_project_for_owner(session, project_id, user)
+        if expected_updated_at is not None:
+            raise precondition_failed()
+        raise _project_not_found()
+    await bump_version(session, OWNER_VERSION, project.owner_id)
+    await bump_version(session, PROJECT_ROW_VERSION, project_id)
+    return project
+
+
+async def _load_task(session: AsyncSession, task_id: int) -> tuple[Task, int, int] | None:
+    row = (await session.execute(TASK_WITH_OWNER_AND_VERSION, {"task_id": task_id})).first()
+    return None if row is None else (row[0], row[1], row[2])
+
+
+async def get_task_for_user(
+    session: AsyncSession, task_id: int, user: User, *, owner_only: bool = False
+) -> Task:
+    # A project's owner never changes, so it is cached alongside the task.
+    loaded = await entity_cache.load(session, Task, task_id, lambda: _load_task(session, task_id))
+    if loaded is None:
+        raise _task_not_found()
+    task, owner_id = loaded
+    _check_task_access(user, owner_id, task.assignee_id, owner_only)
+    return task
+
+
+def _check_task_access(
+    user: User, owner_id: int, assignee_id: int | None, owner_only: bool = False
+) -> None:
+    if owner_only and owner_id != user.id and user.role != UserRole.ADMIN:
+        raise _not_project_owner()
+    if not can_access_task(user, owner_id, assignee_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+
+async def task_stamp_for_user(session: AsyncSession, task_id: int, user: User) -> datetime:
+    row = (await session.execute(TASK_STAMP_WITH_OWNER, {"task_id": task_id})).first()
+    if row is None:
+        raise _task_not_found()
+    updated_at, assignee_id, owner_id = row
+    _check_task_access(user, owner_id, assignee_id)
+    return updated_at
+
+
+async def update_task_for_user(
+    session: AsyncSession,
+    task_id: int,
+    user: User,
+    values: dict[str, Any],
+    expected_updated_at: datetime | None = None,
+) -> Task:
+    statement = update(Task).where(Task.id == task_id, task_access_clause(user))  # type: ignore[arg-type]
+    if expected_updated_at is not None:
+        statement = statement.where(Task.updated_at == expected_updated_at)  # type: ignore[arg-type]
+    result = await session.execute(statement.values(**values).returning(Task))
+    task = result.scalar_one_or_none()
+    if task is None:
+        # Only the failure path pays for a second query, to pick 404, 403 or 412.
+        await get_task_for_user(session, task_id, user)
+        if expected_updated_at is not None:
+            raise precondition_failed()
+        raise _task_not_found()
+    await bump_version(session, PROJECT_VERSION, task.project_id)
+    await bump_version(session, TASK_ROW_VERSION, task_id)
+    return task
+
+
+async def delete_task_for_user(session: AsyncSession, task_id: int, user: User) -> None:
+    result = await session.execute(
+        delete(Task)
+        .where(Task.id == task_id, task_access_clause(user, owner_only=True))  # type: ignore[arg-type]
+        .returning(Task.project_id)
+        .execution_options(synchronize_session=False)
+    )
+    project_id = result.scalar_one_or_none()
+    if project_id is None:
+        await get_task_for_user(session, task_id, user, owner_only=True)
+        raise _task_not_found()
+    await session.execute(
+        delete(Comment)
+        .where(Comment.task_id == task_id)  # type: ignore[arg-type]
+        .execution_options(synchronize_session=False)
+    )
+    await adjust_counter(session, PROJECT_TASKS, project_id, -1)
+    await bump_version(session, PROJECT_VERSION, project_id)
+    await drop_counter(session, TASK_COMMENTS, task_id)
+    # Keep the version row: SQLite may reuse the id, and tags must never repeat.
+    await bump_version(session, TASK_VERSION, task_id)
+    await bump_version(session, TASK_ROW_VERSION, task_id)
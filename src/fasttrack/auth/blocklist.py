@@ -1,36 +1,85 @@
 from datetime import datetime
 
+from sqlalchemy import bindparam
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import Field, SQLModel, select
+from sqlmodel import Field, SQLModel, delete, select
+
+from fasttrack.auth.revocation import revocation_cache
 
 
 class BlockedToken(SQLModel, table=True):
     __tablename__ = "blocked_tokens"
+    # Workers sync by id > last_id; a plain rowid would hand purged ids out again.
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id: int | None = Field(default=None, primary_key=True)
     jti: str = Field(unique=True, index=True)
     blocked_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: datetime
+    expires_at: datetime = Field(index=True)
+
 
+BLOCKED_TOKEN_BY_JTI = select(BlockedToken.id).where(BlockedToken.jti == bindparam("jti"))
 
-async def block_token(session: AsyncSession, jti: str, expires_at: datetime) -> None:
-    token = BlockedToken(jti=jti, expires_at=expires_at)
-    session.add(token)
+
+async def block_token(session: AsyncSession, jti: str, expires_at: datetime) -> bool:
+    # False when the jti was already blocked, e.g. by a concurrent request on another worker.
+    statement = (
+        insert(BlockedToken)
+        .values(jti=jti, expires_at=expires_at, blocked_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=[BlockedToken.jti])
+        .returning(BlockedToken.id)
+    )
+    result = await session.execute(statement)
+    blocked = result.scalar_one_or_none() is not None
     await session.commit()
+    revocation_cache.add(jti)
+    return blocked
 
 
-async def is_blocked(session: AsyncSession, jti: str) -> bool:
-    result = await session.execute(select(BlockedToken).where(BlockedToken.jti == jti))
-    return result.scalar_one_or_none() is not None
+async def is_blocked(session: AsyncSession, jti: str, *, authoritative: bool = False) -> bool:
+    # The cache only learns about other workers' revocations on its next sync, so a "not
+    # blocked" answer can be REVOCATION_SYNC_INTERVAL old. Callers about to act on a token
+    # (refresh, logout) pass authoritative=True and always ask the database.
+    cached = revocation_cache.check(jti)
+    if cached is not None and (cached or not authoritative):
+        return cached
+    result = await session.execute(BLOCKED_TOKEN_BY_JTI, {"jti": jti})
+    blocked = result.scalar_one_or_none() is not None
+    revocation_cache.record_lookup(jti, blocked)
+    return blocked
 
 
-async def cleanup_expired_tokens(session: AsyncSession) -> int:
-    result = await session.execute(
-        select(BlockedToken).where(BlockedToken.expires_at < datetime.utcnow())
+async def sync_revocation_cache(session: AsyncSession) -> None:
+    query = select(BlockedToken.id, BlockedToken.jti)
+    if revocation_cache.ready:
+        query = query.where(BlockedToken.id > revocation_cache.last_id)
+    result = await session.execute(query)
+    rows = result.all()
+    jtis = [row.jti for row in rows]
+    if revocation_cache.ready:
+        last_id = max((row.id for row in rows), default=revocation_cache.last_id)
+        revocation_cache.extend(jtis, last_id)
+    else:
+        # A full reload starts over, even when the sweeper has just emptied the table.
+        revocation_cache.rebuild(jtis, max((row.id for row in rows), default=0))
+
+
+async def cleanup_expired_tokens(session: AsyncSession, chunk_size: int = 1000) -> int:
+    expired_ids = (
+        select(BlockedToken.id)
+        .where(BlockedToken.expires_at < datetime.utcnow())
+        .limit(chunk_size)
     )
-    expired = result.scalars().all()
-    count = len(expired)
-    for token in expired:
-        await session.delete(token)
-    await session.commit()
-    return count
+    statement = (
+        delete(BlockedToken)
+        .where(BlockedToken.id.in_(expired_ids))
+        .execution_options(synchronize_session=False)
+    )
+    purged = 0
+    while True:
+        result = await session.execute(statement)
+        await session.commit()
+        purged += result.rowcount
+        if result.rowcount < chunk_size:
+            return purged
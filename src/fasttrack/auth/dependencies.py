@@ -1,18 +1,26 @@
+from datetime import UTC
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
 from fasttrack.auth.blocklist import is_blocked
 from fasttrack.auth.jwt import decode_token
+from fasttrack.auth.principals import cache_principal, cached_principal
 from fasttrack.database import get_session
 from fasttrack.models.user import User, UserRole
+from fasttrack.queries import USER_BY_ID
 
 security = HTTPBearer()
 
 
+def issued_before_epoch(payload: dict, user: User) -> bool:
+    if user.tokens_valid_after is None:
+        return False
+    return payload.get("iat", 0) < user.tokens_valid_after.replace(tzinfo=UTC).timestamp()
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -33,10 +41,18 @@ async def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
     user_id = int(payload["sub"])
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    if user is None or not user.is_active:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    user = cached_principal(session, user_id)
+    if user is None:
+        result = await session.execute(USER_BY_ID, {"user_id": user_id})
+        user = result.scalar_one_or_none()
+        if user is None or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+            )
+        cache_principal(user)
+
+    if issued_before_epoch(payload, user):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
     return user
 
@@ -1,19 +1,28 @@
+import hashlib
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 
 from jose import JWTError, jwt
 
 from fasttrack.config import get_settings
+from fasttrack.utils.cache import TTLCache
+
+verified_token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=get_settings().JWT_CACHE_SIZE, ttl=0
+)
 
 
 def create_access_token(user_id: int, role: str) -> str:
     settings = get_settings()
-    expire = datetime.now(UTC) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = datetime.now(UTC)
+    expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
         "sub": str(user_id),
         "role": role,
         "type": "access",
         "exp": expire,
+        "iat": now.timestamp(),
         "jti": str(uuid.uuid4()),
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
@@ -21,19 +30,34 @@ def create_access_token(user_id: int, role: str) -> str:
 
 def create_refresh_token(user_id: int) -> str:
     settings = get_settings()
-    expire = datetime.now(UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now = datetime.now(UTC)
+    expire = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     payload = {
         "sub": str(user_id),
         "type": "refresh",
         "exp": expire,
+        "iat": now.timestamp(),
         "jti": str(uuid.uuid4()),
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
-def decode_token(token: str) -> dict:
+def _verify_token(token: str) -> dict:
     settings = get_settings()
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
     except JWTError as e:
         raise ValueError(f"Invalid token: {e}") from e
+
+
+def decode_token(token: str) -> dict:
+    key = hashlib.blake2b(token.encode(), digest_size=32).digest()
+    claims = verified_token_cache.get(key)
+    if claims is None:
+        claims = _verify_token(token)
+        if "exp" in claims:
+            verified_token_cache.set(key, claims, ttl=claims["exp"] - time.time())
+    elif claims["exp"] <= time.time():
+        verified_token_cache.pop(key)
+        raise ValueError("Invalid token: Signature has expired.")
+    return dict(claims)
@@ -1,5 +1,79 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import bcrypt
 
+from fasttrack.config import get_settings
+
+
+class PasswordPoolFull(Exception):
+    pass
+
+
+class PasswordExecutor:
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._workers = workers
+        self._max_pending = max_pending
+        self.pending = 0
+        self._pending_lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    async def run[T](self, fn: Callable[..., T], *args: object) -> T:
+        with self._pending_lock:
+            if self.pending >= self._max_pending:
+                self.rejected += 1
+                raise PasswordPoolFull
+            self.pending += 1
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[float, T]:
+            return time.perf_counter(), fn(*args)
+
+        # The job keeps its slot until the thread is done with it, even if the awaiting
+        # request is cancelled first (e.g. the client disconnected mid-login).
+        future = self._executor.submit(timed)
+        future.add_done_callback(self._release)
+        started, result = await asyncio.wrap_future(future)
+        wait_ms = (started - submitted) * 1000
+        self.completed += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        return result
+
+    def _release(self, future: Future) -> None:
+        with self._pending_lock:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int | float]:
+        wait_ms_avg = self.wait_ms_total / self.completed if self.completed else 0.0
+        return {
+            "workers": self._workers,
+            "pending": self.pending,
+            "queue_depth": max(0, self.pending - self._workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms_avg": round(wait_ms_avg, 2),
+            "wait_ms_max": round(self.wait_ms_max, 2),
+        }
+
+
+settings = get_settings()
+
+password_executor = PasswordExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
 
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
@@ -7,3 +81,11 @@ def hash_password(password: str) -> str:
 
 def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed.encode())
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_executor.run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    return await password_executor.run(verify_password, password, hashed)
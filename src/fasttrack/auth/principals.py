@@ -0,0 +1,33 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from fasttrack.config import get_settings
+from fasttrack.models.user import User
+from fasttrack.utils.cache import TTLCache
+
+settings = get_settings()
+
+principal_cache: TTLCache[int, dict[str, Any]] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+
+def cache_principal(user: User) -> None:
+    principal_cache.set(user.id, user.model_dump())  # type: ignore[arg-type]
+
+
+def cached_principal(session: AsyncSession, user_id: int) -> User | None:
+    data = principal_cache.get(user_id)
+    if data is None:
+        return None
+    # Each request gets its own instance, attached to its session without a SELECT.
+    user = User(**data)
+    make_transient_to_detached(user)
+    session.add(user)
+    return user
+
+
+def invalidate_principal(user_id: int) -> None:
+    principal_cache.pop(user_id)
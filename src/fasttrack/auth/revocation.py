@@ -0,0 +1,115 @@
+import hashlib
+import math
+from collections import OrderedDict
+
+from fasttrack.config import get_settings
+
+
+class BloomFilter:
+    __slots__ = ("_bits", "_hashes", "_size", "count")
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self._size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RevocationCache:
+    def __init__(self, capacity: int, error_rate: float, recent_size: int) -> None:
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._recent_size = recent_size
+        self._filter = BloomFilter(capacity, error_rate)
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        self.ready = False
+        self.last_id = 0
+        self.hits = 0
+        self.misses = 0
+        self.false_positives = 0
+
+    def _remember(self, jti: str) -> None:
+        self._recent[jti] = None
+        self._recent.move_to_end(jti)
+        if len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
+    def add(self, jti: str) -> None:
+        if self._filter.count >= self._capacity:
+            # An overfull filter degrades into "always maybe"; grow on the next rebuild.
+            self.ready = False
+        self._filter.add(jti)
+        self._remember(jti)
+
+    def rebuild(self, jtis: list[str], last_id: int) -> None:
+        self._capacity = max(self._capacity, len(jtis) * 2)
+        self._filter = BloomFilter(self._capacity, self._error_rate)
+        for jti in jtis:
+            self._filter.add(jti)
+        self.last_id = last_id
+        self.ready = True
+
+    def extend(self, jtis: list[str], last_id: int) -> None:
+        for jti in jtis:
+            self.add(jti)
+        self.last_id = max(self.last_id, last_id)
+
+    def invalidate(self) -> None:
+        self.ready = False
+
+    def check(self, jti: str) -> bool | None:
+        if jti in self._recent:
+            self._recent.move_to_end(jti)
+            self.hits += 1
+            return True
+        if self.ready and jti not in self._filter:
+            self.hits += 1
+            return False
+        self.misses += 1
+        return None
+
+    def record_lookup(self, jti: str, blocked: bool) -> None:
+        if blocked:
+            self._remember(jti)
+        elif self.ready:
+            self.false_positives += 1
+
+    def clear(self) -> None:
+        self._filter = BloomFilter(self._capacity, self._error_rate)
+        self._recent.clear()
+        self.ready = False
+        self.last_id = 0
+        self.hits = self.misses = self.false_positives = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "false_positives": self.false_positives,
+            "filter_entries": self._filter.count,
+            "recent_entries": len(self._recent),
+        }
+
+
+settings = get_settings()
+
+revocation_cache = RevocationCache(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+    recent_size=settings.REVOCATION_RECENT_SIZE,
+)
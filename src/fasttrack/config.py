@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -8,12 +9,51 @@ class Settings(BaseSettings):
 
     SECRET_KEY: str = "change-me-to-a-random-secret"
     DATABASE_URL: str = "sqlite+aiosqlite:///./fasttrack.db"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_WRITE_TIMEOUT: float = 10.0
+    DB_QUERY_CACHE_SIZE: int = 500
+    PAGE_SIZE_MAX: int = 100
+    COUNT_ESTIMATE_CAP: int = 1000
+    EXPORT_BATCH_SIZE: int = 500
+    GROUP_COMMIT_ENABLED: bool = False
+    GROUP_COMMIT_WINDOW_MS: float = 2.0
+    GROUP_COMMIT_MAX_BATCH: int = 64
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 65_536
+    SQLITE_MMAP_SIZE: int = 268_435_456
+    SQLITE_TEMP_STORE: str = "MEMORY"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 60
+    RATE_LIMIT_BACKEND: Literal["memory", "sqlite"] = "memory"
+    RATE_LIMIT_SQLITE_PATH: str = "./ratelimit.db"
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
     JWT_ALGORITHM: str = "HS256"
+    JWT_CACHE_SIZE: int = 10_000
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.01
+    REVOCATION_RECENT_SIZE: int = 4096
+    REVOCATION_SYNC_INTERVAL: int = 30
+    BLOCKLIST_SWEEP_INTERVAL: int = 300
+    BLOCKLIST_SWEEP_CHUNK_SIZE: int = 1000
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_RETRY_AFTER: int = 1
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL: int = 30
+    ENTITY_CACHE_SIZE: int = 10_000
+    ENTITY_CACHE_TTL: int = 300
+    ENTITY_CACHE_SYNC_INTERVAL: int = 5
+    RESPONSE_CACHE_MAX_BYTES: int = 33_554_432
 
 
 @lru_cache
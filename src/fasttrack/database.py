@@ -1,6 +1,9 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
@@ -8,11 +11,112 @@ from fasttrack.config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with SQLModelAsyncSession(engine) as session:
+class StatementCacheStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def record(self, conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        if context is None:
+            return
+        if context.cache_hit == context.dialect.CACHE_HIT:
+            self.hits += 1
+        elif context.cache_hit == context.dialect.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def stats(self) -> dict[str, int | float]:
+        cached = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_ratio": round(self.hits / cached, 4) if cached else 0.0,
+        }
+
+
+statement_cache_stats = StatementCacheStats()
+
+
+def _apply_sqlite_profile(dbapi_connection, connection_record) -> None:  # noqa: ANN001
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}")
+    cursor.close()
+
+
+def _apply_query_only(dbapi_connection, connection_record) -> None:  # noqa: ANN001
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def build_engine(
+    url: str,
+    *,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_timeout: float | None = None,
+    read_only: bool = False,
+) -> AsyncEngine:
+    options: dict = {"echo": False, "query_cache_size": settings.DB_QUERY_CACHE_SIZE}
+    database = make_url(url).database
+    if database and database != ":memory:":
+        options.update(
+            pool_size=settings.DB_POOL_SIZE if pool_size is None else pool_size,
+            max_overflow=settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT if pool_timeout is None else pool_timeout,
+        )
+    async_engine = create_async_engine(url, **options)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", statement_cache_stats.record)
+    if async_engine.dialect.name == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _apply_sqlite_profile)
+        if read_only:
+            event.listen(async_engine.sync_engine, "connect", _apply_query_only)
+    return async_engine
+
+
+# SQLite allows one writer at a time, so all writes share a single pooled connection.
+# Waiters queue in FIFO order and give up after DB_WRITE_TIMEOUT.
+engine = build_engine(
+    settings.DATABASE_URL,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=settings.DB_WRITE_TIMEOUT,
+)
+read_engine = build_engine(settings.DATABASE_URL, read_only=True)
+
+
+def engine_for(method: str) -> AsyncEngine:
+    return read_engine if method in READ_METHODS else engine
+
+
+def open_session(bind: AsyncEngine) -> AsyncSession:
+    # Committed objects keep their loaded state, so responses never need a re-SELECT.
+    return SQLModelAsyncSession(bind, expire_on_commit=False)
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with open_session(engine_for(request.method)) as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with open_session(read_engine) as session:
+        yield session
+
+
+async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
+    async with open_session(engine) as session:
         yield session
 
 
@@ -1,15 +1,36 @@
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from fasttrack.auth.blocklist import BlockedToken  # noqa: F401
-from fasttrack.database import create_db_and_tables
+from fasttrack.auth.dependencies import AdminUser
+from fasttrack.auth.jwt import verified_token_cache
+from fasttrack.auth.password import password_executor
+from fasttrack.auth.principals import principal_cache
+from fasttrack.auth.revocation import revocation_cache
+from fasttrack.config import get_settings
+from fasttrack.database import create_db_and_tables, statement_cache_stats
+from fasttrack.middleware.compression import CompressionMiddleware
 from fasttrack.middleware.cors import add_cors_middleware
 from fasttrack.middleware.ratelimit import RateLimitMiddleware
-from fasttrack.models import Comment, Project, Task, User  # noqa: F401
+from fasttrack.models import Comment, Counter, Project, Task, User  # noqa: F401
 from fasttrack.routers import auth, comments, projects, tasks, users
+from fasttrack.tasks.background import (
+    run_periodically,
+    sweep_blocked_tokens,
+    sweep_stats,
+    sync_entity_cache,
+    sync_revocations,
+)
+from fasttrack.utils.entity_cache import entity_cache
+from fasttrack.utils.group_commit import group_commit
+from fasttrack.utils.response_cache import response_cache
 from fasttrack.websocket.handler import router as ws_router
 from fasttrack.websocket.manager import manager
 
@@ -19,10 +40,30 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting up fasttrack API")
+    settings = get_settings()
     await create_db_and_tables()
+    await sync_revocations()
+    background = [
+        asyncio.create_task(
+            run_periodically(settings.REVOCATION_SYNC_INTERVAL, sync_revocations)
+        ),
+        asyncio.create_task(
+            run_periodically(settings.BLOCKLIST_SWEEP_INTERVAL, sweep_blocked_tokens)
+        ),
+        asyncio.create_task(
+            run_periodically(settings.ENTITY_CACHE_SYNC_INTERVAL, sync_entity_cache)
+        ),
+    ]
     yield
     logger.info("Shutting down fasttrack API")
+    for task in background:
+        task.cancel()
+    for task in background:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await group_commit.close()
     await manager.shutdown()
+    password_executor.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -35,6 +76,7 @@ def create_app() -> FastAPI:
 
     add_cors_middleware(app)
     app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(CompressionMiddleware)
 
     app.include_router(auth.router, prefix="/api/v1")
     app.include_router(users.router, prefix="/api/v1")
@@ -43,10 +85,32 @@ def create_app() -> FastAPI:
     app.include_router(comments.router, prefix="/api/v1")
     app.include_router(ws_router)
 
+    @app.exception_handler(PoolTimeoutError)
+    async def database_busy(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Database busy, retry shortly"},
+            headers={"Retry-After": "1"},
+        )
+
     @app.get("/health", tags=["health"])
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/metrics", tags=["health"])
+    async def metrics(admin: AdminUser) -> dict[str, dict[str, int | float]]:
+        return {
+            "revocation_cache": revocation_cache.stats(),
+            "blocklist_sweep": sweep_stats,
+            "password_pool": password_executor.stats(),
+            "principal_cache": principal_cache.stats(),
+            "jwt_cache": verified_token_cache.stats(),
+            "group_commit": group_commit.stats(),
+            "statement_cache": statement_cache_stats.stats(),
+            "entity_cache": entity_cache.stats(),
+            "response_cache": response_cache.stats(),
+        }
+
     return app
 
 
@@ -0,0 +1,215 @@
+import zlib
+from collections.abc import Callable
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fasttrack.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSIBLE_TYPES = frozenset(
+    {"application/json", "application/x-ndjson", "application/javascript", "image/svg+xml"}
+)
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    # Most preferred first; the client's q-values only decide what is acceptable.
+    settings = get_settings()
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = lambda: ZstdEncoder(settings.COMPRESSION_ZSTD_LEVEL)
+    if brotli is not None:
+        encoders["br"] = lambda: BrotliEncoder(settings.COMPRESSION_BROTLI_QUALITY)
+    encoders["gzip"] = lambda: GzipEncoder(settings.COMPRESSION_GZIP_LEVEL)
+    return encoders
+
+
+def skip_compression[F: Callable](endpoint: F) -> F:
+    endpoint.skip_compression = True  # type: ignore[attr-defined]
+    return endpoint
+
+
+def _qualities(accept_encoding: str) -> dict[str, float]:
+    # Every listed coding with its q-value, refusals (q=0) included.
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    return qualities
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None) -> None:
+        self.app = app
+        if minimum_size is None:
+            minimum_size = get_settings().COMPRESSION_MINIMUM_SIZE
+        self.minimum_size = minimum_size
+        self.encoders = available_encoders()
+
+    def _negotiate(self, scope: Scope) -> str | None:
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if not accept_encoding:
+            return None
+        qualities = _qualities(accept_encoding)
+        wildcard = qualities.get("*", 0.0)
+        for name in self.encoders:
+            # An explicit entry, including an explicit refusal, overrides the wildcard.
+            if qualities.get(name, wildcard) > 0:
+                return name
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (encoding := self._negotiate(scope)) is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, scope, encoding, self)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self, send: Send, scope: Scope, encoding: str, middleware: CompressionMiddleware
+    ) -> None:
+        self._send = send
+        self._scope = scope
+        self._encoding = encoding
+        self._middleware = middleware
+        self._start: Message | None = None
+        self._encoder: Encoder | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self._start is not None:
+            await self._begin(message)
+        elif self._passthrough or self._encoder is None:
+            await self._send(message)
+        else:
+            await self._send_chunk(message)
+
+    def _opted_out(self) -> bool:
+        # The router records the matched endpoint in the shared scope before it runs.
+        return getattr(self._scope.get("endpoint"), "skip_compression", False)
+
+    async def _begin(self, message: Message) -> None:
+        start, self._start = self._start, None
+        assert start is not None
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        streaming = message.get("more_body", False)
+        compressible = _is_compressible(headers)
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+        if (
+            not compressible
+            or self._opted_out()
+            or (not streaming and len(body) < self._middleware.minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._encoder = self._middleware.encoders[self._encoding]()
+        headers["Content-Encoding"] = self._encoding
+        if streaming:
+            del headers["Content-Length"]
+            await self._send(start)
+            await self._send_chunk(message)
+            return
+        compressed = self._encoder.compress(body) + self._encoder.finish()
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _send_chunk(self, message: Message) -> None:
+        assert self._encoder is not None
+        body = self._encoder.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        # Flush each chunk so a streaming client is never waiting on our buffer.
+        body += self._encoder.flush() if more_body else self._encoder.finish()
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -1,47 +1,160 @@
+import math
+import sqlite3
 import time
-from collections import defaultdict
+from typing import Protocol
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from fasttrack.config import get_settings
+from fasttrack.config import Settings, get_settings
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, **kwargs) -> None:  # noqa: ANN001, ANN003
-        super().__init__(app, **kwargs)
-        settings = get_settings()
-        self.max_requests = settings.RATE_LIMIT_REQUESTS
-        self.window = settings.RATE_LIMIT_WINDOW
-        self._timestamps: dict[str, list[float]] = defaultdict(list)
+class LimiterBackend(Protocol):
+    def acquire(self, key: str, now: float | None = None) -> float: ...
 
-    def _get_key(self, request: Request) -> str:
-        if hasattr(request.state, "user_id"):
-            return f"user:{request.state.user_id}"
-        client = request.client
-        return f"ip:{client.host}" if client else "ip:unknown"
 
-    def _clean_window(self, key: str, now: float) -> None:
-        cutoff = now - self.window
-        self._timestamps[key] = [t for t in self._timestamps[key] if t > cutoff]
+class GCRALimiter:
+    # Generic cell rate algorithm: each key stores one float, its theoretical arrival
+    # time. Allows bursts of max_requests, then one request per window / max_requests.
+    __slots__ = ("_interval", "_window", "_tat", "_next_sweep", "evictions")
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in ("/docs", "/redoc", "/openapi.json", "/health"):
-            return await call_next(request)
+    def __init__(self, max_requests: int, window: float) -> None:
+        self._interval = window / max_requests
+        self._window = window
+        self._tat: dict[str, float] = {}
+        self._next_sweep = 0.0
+        self.evictions = 0
 
-        key = self._get_key(request)
-        now = time.time()
-        self._clean_window(key, now)
+    def acquire(self, key: str, now: float | None = None) -> float:
+        # Returns 0 when the request is allowed, otherwise the seconds until it would be.
+        if now is None:
+            now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+        tat = max(self._tat.get(key, now), now) + self._interval
+        if tat - now > self._window:
+            return tat - self._window - now
+        self._tat[key] = tat
+        return 0.0
 
-        if len(self._timestamps[key]) >= self.max_requests:
-            oldest = self._timestamps[key][0]
-            retry_after = int(self.window - (now - oldest)) + 1
-            return JSONResponse(
+    def sweep(self, now: float) -> None:
+        # A key whose arrival time has passed is indistinguishable from a new one.
+        before = len(self._tat)
+        self._tat = {key: tat for key, tat in self._tat.items() if tat > now}
+        self.evictions += before - len(self._tat)
+        self._next_sweep = now + self._window
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class SQLiteLimiter:
+    # The same algorithm kept in a WAL-mode SQLite file, so every worker process on the
+    # host shares one budget per client. Each decision is a single atomic upsert; the
+    # state is disposable, so commits are not synced to disk.
+    #
+    # acquire() runs on the event loop, so it waits only BUSY_TIMEOUT_MS for another
+    # worker's write lock. On a locked or broken file the decision falls back to a
+    # process-local GCRALimiter rather than failing or stalling the request.
+    BUSY_TIMEOUT_MS = 5
+    _ACQUIRE = (
+        "INSERT INTO rate_limits (key, tat) VALUES (:key, :now + :interval) "
+        "ON CONFLICT (key) DO UPDATE SET tat = max(tat, :now) + :interval "
+        "WHERE max(tat, :now) + :interval - :now <= :window "
+        "RETURNING tat"
+    )
+
+    def __init__(self, path: str, max_requests: int, window: float) -> None:
+        self._interval = window / max_requests
+        self._window = window
+        self._next_sweep = 0.0
+        self._fallback = GCRALimiter(max_requests, window)
+        self.evictions = 0
+        self.fallbacks = 0
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL) "
+            "WITHOUT ROWID"
+        )
+
+    def acquire(self, key: str, now: float | None = None) -> float:
+        # Wall-clock time: it is the only clock the worker processes share.
+        if now is None:
+            now = time.time()
+        try:
+            return self._acquire(key, now)
+        except sqlite3.OperationalError:
+            self.fallbacks += 1
+            return self._fallback.acquire(key, now)
+
+    def _acquire(self, key: str, now: float) -> float:
+        if now >= self._next_sweep:
+            self.sweep(now)
+        params = {"key": key, "now": now, "interval": self._interval, "window": self._window}
+        if self._conn.execute(self._ACQUIRE, params).fetchone() is not None:
+            return 0.0
+        # Rejected: nothing was written, so read the arrival time to compute Retry-After.
+        row = self._conn.execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+        tat = max(row[0], now) if row else now
+        return max(tat + self._interval - self._window - now, 0.0)
+
+    def sweep(self, now: float) -> None:
+        cursor = self._conn.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+        self.evictions += cursor.rowcount
+        self._next_sweep = now + self._window
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM rate_limits").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def build_limiter(settings: Settings) -> LimiterBackend:
+    limit, window = settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_WINDOW
+    if settings.RATE_LIMIT_BACKEND == "sqlite":
+        return SQLiteLimiter(settings.RATE_LIMIT_SQLITE_PATH, limit, window)
+    return GCRALimiter(limit, window)
+
+
+# Matched against the raw path before any request object exists; these bypass the limiter.
+EXEMPT_PATHS = frozenset({"/docs", "/redoc", "/openapi.json", "/health"})
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        exempt_paths: frozenset[str] = EXEMPT_PATHS,
+        limiter: LimiterBackend | None = None,
+    ) -> None:
+        self.app = app
+        self.exempt_paths = exempt_paths
+        self.limiter = limiter if limiter is not None else build_limiter(get_settings())
+
+    @staticmethod
+    def _get_key(scope: Scope) -> str:
+        state = scope.get("state") or {}
+        if "user_id" in state:
+            return f"user:{state['user_id']}"
+        client = scope.get("client")
+        return f"ip:{client[0]}" if client else "ip:unknown"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        wait = self.limiter.acquire(self._get_key(scope))
+        if wait > 0:
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests"},
-                headers={"Retry-After": str(retry_after)},
+                headers={"Retry-After": str(max(1, math.ceil(wait)))},
             )
-
-        self._timestamps[key].append(now)
-        return await call_next(request)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
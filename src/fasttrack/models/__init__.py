@@ -1,10 +1,12 @@
 from fasttrack.models.comment import Comment
+from fasttrack.models.counter import Counter
 from fasttrack.models.project import Project, ProjectStatus
 from fasttrack.models.task import Task, TaskPriority, TaskStatus
 from fasttrack.models.user import User, UserRole
 
 __all__ = [
     "Comment",
+    "Counter",
     "Project",
     "ProjectStatus",
     "Task",
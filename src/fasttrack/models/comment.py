@@ -1,10 +1,12 @@
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Comment(SQLModel, table=True):
     __tablename__ = "comments"
+    __table_args__ = (Index("ix_comments_task_id_id", "task_id", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     body: str
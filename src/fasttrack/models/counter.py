@@ -0,0 +1,9 @@
+from sqlmodel import Field, SQLModel
+
+
+class Counter(SQLModel, table=True):
+    __tablename__ = "counters"
+
+    scope: str = Field(primary_key=True, max_length=50)
+    scope_id: int = Field(primary_key=True)
+    value: int = Field(default=0)
@@ -1,6 +1,7 @@
 import enum
 from datetime import datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -11,6 +12,7 @@ class ProjectStatus(enum.StrEnum):
 
 class Project(SQLModel, table=True):
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_owner_id_id", "owner_id", "id"),)
 
     id: int | None = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
@@ -1,6 +1,7 @@
 import enum
 from datetime import datetime
 
+from sqlalchemy import ColumnElement, Index, case, literal_column
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -18,6 +19,13 @@ class TaskPriority(enum.StrEnum):
 
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+        Index("ix_tasks_project_id_status_id", "project_id", "status", "id"),
+        Index("ix_tasks_project_id_priority_id", "project_id", "priority", "id"),
+        Index("ix_tasks_project_id_assignee_id_id", "project_id", "assignee_id", "id"),
+        Index("ix_tasks_project_id_updated_at_id", "project_id", "updated_at", "id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     title: str = Field(max_length=300)
@@ -32,3 +40,34 @@ class Task(SQLModel, table=True):
     project: "Project" = Relationship(back_populates="tasks")  # type: ignore[name-defined]  # noqa: F821
     assignee: "User" = Relationship(back_populates="assigned_tasks")  # type: ignore[name-defined]  # noqa: F821
     comments: list["Comment"] = Relationship(back_populates="task")  # type: ignore[name-defined]  # noqa: F821
+
+
+def enum_rank(column, members: type[enum.Enum]) -> ColumnElement[int]:  # noqa: ANN001
+    # Declaration order, not the stored member names. Literal SQL, so queries render the
+    # exact expression the rank indexes were built on and SQLite can use them.
+    return case(
+        *(
+            (column == literal_column(f"'{member.name}'"), literal_column(str(rank)))
+            for rank, member in enumerate(members)
+        )
+    )
+
+
+# Sort keys ordered by rank: the expression, and the members in rank order.
+TASK_RANKS = {
+    "priority": (enum_rank(Task.priority, TaskPriority), tuple(TaskPriority)),
+    "status": (enum_rank(Task.status, TaskStatus), tuple(TaskStatus)),
+}
+
+Index(
+    "ix_tasks_project_id_priority_rank_id",
+    Task.project_id,
+    enum_rank(Task.__table__.c.priority, TaskPriority),  # type: ignore[attr-defined]
+    Task.id,
+)
+Index(
+    "ix_tasks_project_id_status_rank_id",
+    Task.project_id,
+    enum_rank(Task.__table__.c.status, TaskStatus),  # type: ignore[attr-defined]
+    Task.id,
+)
@@ -20,6 +20,7 @@ class User(SQLModel, table=True):
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    tokens_valid_after: datetime | None = Field(default=None)
 
     projects: list["Project"] = Relationship(back_populates="owner")  # type: ignore[name-defined]  # noqa: F821
     assigned_tasks: list["Task"] = Relationship(back_populates="assignee")  # type: ignore[name-defined]  # noqa: F821
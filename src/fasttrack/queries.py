@@ -0,0 +1,44 @@
+from sqlalchemy import ColumnElement, bindparam, func
+from sqlmodel import select
+
+from fasttrack.models.comment import Comment
+from fasttrack.models.counter import Counter
+from fasttrack.models.project import Project
+from fasttrack.models.task import Task
+from fasttrack.models.user import User
+from fasttrack.utils.counters import PROJECT_ROW_VERSION, TASK_ROW_VERSION
+
+# Fixed-shape lookups built once at import. Reusing the same statement object skips
+# construction and cache-key generation; values are supplied per call as bind params.
+
+
+
+def _row_version(scope: str, record_id: ColumnElement[int]) -> ColumnElement[int]:
+    version = select(Counter.value).where(Counter.scope == scope, Counter.scope_id == record_id)
+    return func.coalesce(version.scalar_subquery(), 0)
+
+
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+COMMENT_BY_ID = select(Comment).where(Comment.id == bindparam("comment_id"))
+
+# Entity cache loads: the row version comes from the same statement, so it always
+# matches the row it is stored with.
+PROJECT_WITH_VERSION = select(
+    Project, _row_version(PROJECT_ROW_VERSION, Project.id)  # type: ignore[arg-type]
+).where(Project.id == bindparam("project_id"))
+TASK_WITH_OWNER_AND_VERSION = (
+    select(Task, Project.owner_id, _row_version(TASK_ROW_VERSION, Task.id))  # type: ignore[arg-type]
+    .join(Project, Project.id == Task.project_id)
+    .where(Task.id == bindparam("task_id"))
+)
+
+# Just enough to authorize and compute an ETag without loading the full row.
+PROJECT_STAMP = select(Project.updated_at, Project.owner_id).where(
+    Project.id == bindparam("project_id")
+)
+TASK_STAMP_WITH_OWNER = (
+    select(Task.updated_at, Task.assignee_id, Project.owner_id)
+    .join(Project, Project.id == Task.project_id)
+    .where(Task.id == bindparam("task_id"))
+)
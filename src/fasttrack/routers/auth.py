@@ -1,52 +1,79 @@
 from datetime import UTC, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
 from fasttrack.auth.blocklist import block_token, is_blocked
-from fasttrack.auth.dependencies import CurrentUser
+from fasttrack.auth.dependencies import CurrentUser, issued_before_epoch
 from fasttrack.auth.jwt import create_access_token, create_refresh_token, decode_token
-from fasttrack.auth.password import hash_password, verify_password
-from fasttrack.database import get_session
+from fasttrack.auth.password import (
+    PasswordPoolFull,
+    hash_password_async,
+    verify_password_async,
+)
+from fasttrack.auth.principals import invalidate_principal
+from fasttrack.config import get_settings
+from fasttrack.database import get_read_session, get_session
+from fasttrack.middleware.compression import skip_compression
 from fasttrack.models.user import User
+from fasttrack.queries import USER_BY_EMAIL, USER_BY_ID
 from fasttrack.schemas.auth import LoginRequest, RefreshRequest, TokenResponse
 from fasttrack.schemas.user import UserCreate, UserRead
+from fasttrack.utils.serialization import FastJSONRoute, render
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=FastJSONRoute)
+
+
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server busy, retry shortly",
+        headers={"Retry-After": str(get_settings().PASSWORD_HASH_RETRY_AFTER)},
+    )
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def register(
     data: UserCreate,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
-    result = await session.execute(select(User).where(User.email == data.email))
+) -> Response:
+    # Hash before touching the session so the write connection is not held during bcrypt.
+    try:
+        hashed_password = await hash_password_async(data.password)
+    except PasswordPoolFull:
+        raise _password_pool_busy() from None
+    result = await session.execute(USER_BY_EMAIL, {"email": data.email})
     if result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Email already registered"
         )
     user = User(
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=hashed_password,
         display_name=data.display_name,
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
-    return user
+    return render(user, UserRead, status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=TokenResponse)
+@skip_compression
 async def login(
     data: LoginRequest,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> TokenResponse:
-    result = await session.execute(select(User).where(User.email == data.email))
+    result = await session.execute(USER_BY_EMAIL, {"email": data.email})
     user = result.scalar_one_or_none()
-    if not user or not verify_password(data.password, user.hashed_password):
+    try:
+        valid = user is not None and await verify_password_async(
+            data.password, user.hashed_password
+        )
+    except PasswordPoolFull:
+        raise _password_pool_busy() from None
+    if not user or not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
@@ -59,6 +86,7 @@ async def login(
 
 
 @router.post("/refresh", response_model=TokenResponse)
+@skip_compression
 async def refresh(
     data: RefreshRequest,
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -76,21 +104,26 @@ async def refresh(
         )
 
     jti = payload.get("jti")
-    if jti and await is_blocked(session, jti):
+    if jti and await is_blocked(session, jti, authoritative=True):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
         )
 
-    # Revoke old refresh token
+    # Revoke old refresh token; losing the insert race means another request rotated it.
     if jti:
         exp = datetime.fromtimestamp(payload["exp"], tz=UTC)
-        await block_token(session, jti, exp)
+        if not await block_token(session, jti, exp):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
+            )
 
     user_id = int(payload["sub"])
-    result = await session.execute(select(User).where(User.id == user_id))
+    result = await session.execute(USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if issued_before_epoch(payload, user):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
     return TokenResponse(
         access_token=create_access_token(user.id, user.role),  # type: ignore[arg-type]
@@ -106,8 +139,32 @@ async def logout(
         HTTPAuthorizationCredentials, Depends(HTTPBearer())
     ],
 ) -> None:
+    user_id = user.id
     payload = decode_token(credentials.credentials)
     jti = payload.get("jti")
+    if jti and await is_blocked(session, jti, authoritative=True):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
     if jti:
         exp = datetime.fromtimestamp(payload["exp"], tz=UTC)
         await block_token(session, jti, exp)
+    invalidate_principal(user_id)  # type: ignore[arg-type]
+
+
+@router.post(
+    "/logout-all",
+    status_code=status.HTTP_204_NO_CONTENT,
+    description=(
+        "Revoke every token issued to the caller. Refresh tokens are rejected at once; "
+        "other workers may accept existing access tokens for up to PRINCIPAL_CACHE_TTL "
+        "seconds, until their cached principal expires."
+    ),
+)
+async def logout_all(
+    user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> None:
+    user_id = user.id
+    user.tokens_valid_after = datetime.utcnow()
+    session.add(user)
+    await session.commit()
+    invalidate_principal(user_id)  # type: ignore[arg-type]
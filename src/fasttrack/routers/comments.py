@@ -1,41 +1,30 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from fasttrack.auth.access import get_task_for_user, task_stamp_for_user
 from fasttrack.auth.dependencies import CurrentUser
 from fasttrack.database import get_session
 from fasttrack.models.comment import Comment
-from fasttrack.models.project import Project
-from fasttrack.models.task import Task
 from fasttrack.models.user import UserRole
+from fasttrack.queries import COMMENT_BY_ID
 from fasttrack.schemas.comment import CommentCreate, CommentRead
 from fasttrack.schemas.pagination import PaginatedResponse
+from fasttrack.utils.counters import (
+    TASK_COMMENTS,
+    TASK_VERSION,
+    adjust_counter,
+    bump_version,
+    read_counter,
+)
+from fasttrack.utils.etag import etag_matches, not_modified, version_etag
+from fasttrack.utils.group_commit import GroupCommitWriter, get_group_commit, persist
 from fasttrack.utils.pagination import paginate
+from fasttrack.utils.serialization import FastJSONRoute, parse_fields, render, render_page
 
-router = APIRouter(tags=["comments"])
-
-
-async def _check_task_access(
-    task_id: int, user_id: int, user_role: str, session: AsyncSession
-) -> Task:
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    project_result = await session.execute(
-        select(Project).where(Project.id == task.project_id)
-    )
-    project = project_result.scalar_one_or_none()
-    if (
-        project
-        and project.owner_id != user_id
-        and task.assignee_id != user_id
-        and user_role != UserRole.ADMIN
-    ):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    return task
+router = APIRouter(tags=["comments"], route_class=FastJSONRoute)
 
 
 @router.post(
@@ -48,13 +37,11 @@ async def create_comment(
     data: CommentCreate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Comment:
-    await _check_task_access(task_id, user.id, user.role, session)  # type: ignore[arg-type]
+    writer: Annotated[GroupCommitWriter | None, Depends(get_group_commit)],
+) -> Response:
+    await get_task_for_user(session, task_id, user)
     comment = Comment(body=data.body, task_id=task_id, author_id=user.id)  # type: ignore[arg-type]
-    session.add(comment)
-    await session.commit()
-    await session.refresh(comment)
-    return comment
+    return render(await persist(session, comment, writer), CommentRead, status.HTTP_201_CREATED)
 
 
 @router.get("/tasks/{task_id}/comments", response_model=PaginatedResponse[CommentRead])
@@ -64,10 +51,30 @@ async def list_comments(
     session: Annotated[AsyncSession, Depends(get_session)],
     cursor: str | None = None,
     limit: int = 20,
-) -> PaginatedResponse:
-    await _check_task_access(task_id, user.id, user.role, session)  # type: ignore[arg-type]
+    sort: str = "id",
+    include_total: bool = False,
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    projection = parse_fields(fields, CommentRead)
+    await task_stamp_for_user(session, task_id, user)
+    version = await read_counter(session, TASK_VERSION, task_id)
+    etag = version_etag(TASK_VERSION, task_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     query = select(Comment).where(Comment.task_id == task_id)
-    return await paginate(session, query, Comment, cursor=cursor, limit=limit)
+    page = await paginate(
+        session,
+        query,
+        Comment,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        include_total=include_total,
+        counter=(TASK_COMMENTS, task_id),
+        fields=projection,
+    )
+    return render_page(page, CommentRead, headers={"ETag": etag}, fields=projection)
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -76,7 +83,7 @@ async def delete_comment(
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> None:
-    result = await session.execute(select(Comment).where(Comment.id == comment_id))
+    result = await session.execute(COMMENT_BY_ID, {"comment_id": comment_id})
     comment = result.scalar_one_or_none()
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
@@ -85,4 +92,6 @@ async def delete_comment(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not comment author"
         )
     await session.delete(comment)
+    await adjust_counter(session, TASK_COMMENTS, comment.task_id, -1)
+    await bump_version(session, TASK_VERSION, comment.task_id)
     await session.commit()
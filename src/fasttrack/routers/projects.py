@@ -1,19 +1,42 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from fasttrack.auth.access import (
+    get_project_for_owner,
+    project_stamp_for_owner,
+    update_project_for_owner,
+)
 from fasttrack.auth.dependencies import CurrentUser
 from fasttrack.database import get_session
 from fasttrack.models.project import Project
 from fasttrack.models.user import UserRole
 from fasttrack.schemas.pagination import PaginatedResponse
 from fasttrack.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from fasttrack.utils.counters import (
+    OWNER_VERSION,
+    PROJECT_ROW_VERSION,
+    bump_version,
+    read_counter,
+)
+from fasttrack.utils.entity_cache import entity_cache
+from fasttrack.utils.etag import (
+    etag_matches,
+    expected_updated_at,
+    not_modified,
+    resource_etag,
+    version_etag,
+)
+from fasttrack.utils.export import MEDIA_TYPES, ExportFormat, stream_export
 from fasttrack.utils.pagination import paginate
+from fasttrack.utils.response_cache import response_cache
+from fasttrack.utils.serialization import FastJSONRoute, parse_fields, render, render_page
 
-router = APIRouter(prefix="/projects", tags=["projects"])
+router = APIRouter(prefix="/projects", tags=["projects"], route_class=FastJSONRoute)
 
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -21,12 +44,12 @@ async def create_project(
     data: ProjectCreate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Project:
+) -> Response:
     project = Project(**data.model_dump(), owner_id=user.id)
     session.add(project)
+    await bump_version(session, OWNER_VERSION, user.id)  # type: ignore[arg-type]
     await session.commit()
-    await session.refresh(project)
-    return project
+    return render(project, ProjectRead, status.HTTP_201_CREATED)
 
 
 @router.get("", response_model=PaginatedResponse[ProjectRead])
@@ -35,11 +58,37 @@ async def list_projects(
     session: Annotated[AsyncSession, Depends(get_session)],
     cursor: str | None = None,
     limit: int = 20,
-) -> PaginatedResponse:
+    sort: str = "id",
+    include_total: bool = False,
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    projection = parse_fields(fields, ProjectRead)
     query = select(Project)
+    headers = key = None
     if user.role != UserRole.ADMIN:
+        # Only owner-scoped lists have a version; the admin view across owners is never cached.
         query = query.where(Project.owner_id == user.id)
-    return await paginate(session, query, Project, cursor=cursor, limit=limit)
+        version = await read_counter(session, OWNER_VERSION, user.id)  # type: ignore[arg-type]
+        etag = version_etag(OWNER_VERSION, user.id, version)  # type: ignore[arg-type]
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        headers = {"ETag": etag}
+        key = ("list_projects", user.id, version, cursor, limit, sort, include_total, projection)
+        if (cached := response_cache.get(key, headers=headers)) is not None:
+            return cached
+    page = await paginate(
+        session,
+        query,
+        Project,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        include_total=include_total,
+        fields=projection,
+    )
+    response = render_page(page, ProjectRead, headers=headers, fields=projection)
+    return response if key is None else response_cache.store(key, response)
 
 
 @router.get("/{project_id}", response_model=ProjectRead)
@@ -47,14 +96,17 @@ async def get_project(
     project_id: int,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Project:
-    result = await session.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if project.owner_id != user.id and user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
-    return project
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    projection = parse_fields(fields, ProjectRead)
+    if if_none_match is not None:
+        etag = resource_etag(project_id, await project_stamp_for_owner(session, project_id, user))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    project = await get_project_for_owner(session, project_id, user)
+    etag = resource_etag(project_id, project.updated_at)
+    return render(project, ProjectRead, headers={"ETag": etag}, fields=projection)
 
 
 @router.patch("/{project_id}", response_model=ProjectRead)
@@ -63,20 +115,16 @@ async def update_project(
     data: ProjectUpdate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Project:
-    result = await session.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if project.owner_id != user.id and user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(project, key, value)
-    project.updated_at = datetime.utcnow()
-    session.add(project)
+    if_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    expected = expected_updated_at(if_match, project_id)
+    values = data.model_dump(exclude_unset=True)
+    values["updated_at"] = datetime.utcnow()
+    project = await update_project_for_owner(session, project_id, user, values, expected)
     await session.commit()
-    await session.refresh(project)
-    return project
+    entity_cache.invalidate(Project, project_id)
+    etag = resource_etag(project_id, project.updated_at)
+    return render(project, ProjectRead, headers={"ETag": etag})
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -85,11 +133,28 @@ async def delete_project(
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> None:
-    result = await session.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if project.owner_id != user.id and user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
+    project = await get_project_for_owner(session, project_id, user)
     await session.delete(project)
+    await bump_version(session, OWNER_VERSION, project.owner_id)
+    await bump_version(session, PROJECT_ROW_VERSION, project_id)
     await session.commit()
+    entity_cache.invalidate(Project, project_id)
+
+
+@router.get("/{project_id}/export", response_class=StreamingResponse)
+async def export_project(
+    project_id: int,
+    user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    include_comments: bool = False,
+    after_id: int | None = None,
+) -> StreamingResponse:
+    await get_project_for_owner(session, project_id, user)
+    return StreamingResponse(
+        stream_export(session.bind, project_id, export_format, include_comments, after_id),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="project-{project_id}.{export_format}"'
+        },
+    )
@@ -1,32 +1,39 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from fasttrack.auth.access import (
+    delete_task_for_user,
+    get_project_for_owner,
+    get_task_for_user,
+    task_stamp_for_user,
+    update_task_for_user,
+)
 from fasttrack.auth.dependencies import CurrentUser
 from fasttrack.database import get_session
-from fasttrack.models.project import Project
-from fasttrack.models.task import Task, TaskPriority, TaskStatus
-from fasttrack.models.user import UserRole
+from fasttrack.models.task import TASK_RANKS, Task, TaskPriority, TaskStatus
 from fasttrack.schemas.pagination import PaginatedResponse
 from fasttrack.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from fasttrack.utils.counters import PROJECT_TASKS, PROJECT_VERSION, read_counter
+from fasttrack.utils.entity_cache import entity_cache
+from fasttrack.utils.etag import (
+    etag_matches,
+    expected_updated_at,
+    not_modified,
+    resource_etag,
+    version_etag,
+)
+from fasttrack.utils.group_commit import GroupCommitWriter, get_group_commit, persist
 from fasttrack.utils.pagination import paginate
+from fasttrack.utils.response_cache import response_cache
+from fasttrack.utils.serialization import FastJSONRoute, parse_fields, render, render_page
 
-router = APIRouter(tags=["tasks"])
-
+router = APIRouter(tags=["tasks"], route_class=FastJSONRoute)
 
-async def _get_project_for_owner(
-    project_id: int, user_id: int, user_role: str, session: AsyncSession
-) -> Project:
-    result = await session.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    if not project:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    if project.owner_id != user_id and user_role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
-    return project
+TASK_SORTS = ("id", "updated_at", "priority", "status")
 
 
 @router.post(
@@ -39,13 +46,11 @@ async def create_task(
     data: TaskCreate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Task:
-    await _get_project_for_owner(project_id, user.id, user.role, session)  # type: ignore[arg-type]
+    writer: Annotated[GroupCommitWriter | None, Depends(get_group_commit)],
+) -> Response:
+    await get_project_for_owner(session, project_id, user)
     task = Task(**data.model_dump(), project_id=project_id)
-    session.add(task)
-    await session.commit()
-    await session.refresh(task)
-    return task
+    return render(await persist(session, task, writer), TaskRead, status.HTTP_201_CREATED)
 
 
 @router.get("/projects/{project_id}/tasks", response_model=PaginatedResponse[TaskRead])
@@ -55,11 +60,27 @@ async def list_tasks(
     session: Annotated[AsyncSession, Depends(get_session)],
     cursor: str | None = None,
     limit: int = 20,
+    sort: str = "id",
     task_status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
     assignee_id: int | None = None,
-) -> PaginatedResponse:
-    await _get_project_for_owner(project_id, user.id, user.role, session)  # type: ignore[arg-type]
+    include_total: bool = False,
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    projection = parse_fields(fields, TaskRead)
+    await get_project_for_owner(session, project_id, user)
+    # Read the version before the page so a concurrent write can only make the tag stale.
+    version = await read_counter(session, PROJECT_VERSION, project_id)
+    etag = version_etag(PROJECT_VERSION, project_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    key = (
+        "list_tasks", user.id, project_id, version, cursor, limit, sort,
+        task_status, priority, assignee_id, include_total, projection,
+    )
+    if (cached := response_cache.get(key, headers={"ETag": etag})) is not None:
+        return cached
     query = select(Task).where(Task.project_id == project_id)
     if task_status:
         query = query.where(Task.status == task_status)
@@ -67,7 +88,23 @@ async def list_tasks(
         query = query.where(Task.priority == priority)
     if assignee_id is not None:
         query = query.where(Task.assignee_id == assignee_id)
-    return await paginate(session, query, Task, cursor=cursor, limit=limit)
+    filtered = task_status is not None or priority is not None or assignee_id is not None
+    page = await paginate(
+        session,
+        query,
+        Task,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        sortable=TASK_SORTS,
+        ranks=TASK_RANKS,
+        include_total=include_total,
+        counter=None if filtered else (PROJECT_TASKS, project_id),
+        fields=projection,
+    )
+    return response_cache.store(
+        key, render_page(page, TaskRead, headers={"ETag": etag}, fields=projection)
+    )
 
 
 @router.get("/tasks/{task_id}", response_model=TaskRead)
@@ -75,23 +112,17 @@ async def get_task(
     task_id: int,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Task:
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    project_result = await session.execute(
-        select(Project).where(Project.id == task.project_id)
-    )
-    project = project_result.scalar_one_or_none()
-    if (
-        project
-        and project.owner_id != user.id
-        and task.assignee_id != user.id
-        and user.role != UserRole.ADMIN
-    ):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    return task
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    projection = parse_fields(fields, TaskRead)
+    if if_none_match is not None:
+        etag = resource_etag(task_id, await task_stamp_for_user(session, task_id, user))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    task = await get_task_for_user(session, task_id, user)
+    etag = resource_etag(task_id, task.updated_at)
+    return render(task, TaskRead, headers={"ETag": etag}, fields=projection)
 
 
 @router.patch("/tasks/{task_id}", response_model=TaskRead)
@@ -100,29 +131,15 @@ async def update_task(
     data: TaskUpdate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> Task:
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    project_result = await session.execute(
-        select(Project).where(Project.id == task.project_id)
-    )
-    project = project_result.scalar_one_or_none()
-    if (
-        project
-        and project.owner_id != user.id
-        and task.assignee_id != user.id
-        and user.role != UserRole.ADMIN
-    ):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    for key, value in data.model_dump(exclude_unset=True).items():
-        setattr(task, key, value)
-    task.updated_at = datetime.utcnow()
-    session.add(task)
+    if_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    expected = expected_updated_at(if_match, task_id)
+    values = data.model_dump(exclude_unset=True)
+    values["updated_at"] = datetime.utcnow()
+    task = await update_task_for_user(session, task_id, user, values, expected)
     await session.commit()
-    await session.refresh(task)
-    return task
+    entity_cache.invalidate(Task, task_id)
+    return render(task, TaskRead, headers={"ETag": resource_etag(task_id, task.updated_at)})
 
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -131,15 +148,6 @@ async def delete_task(
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> None:
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    project_result = await session.execute(
-        select(Project).where(Project.id == task.project_id)
-    )
-    project = project_result.scalar_one_or_none()
-    if project and project.owner_id != user.id and user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not project owner")
-    await session.delete(task)
+    await delete_task_for_user(session, task_id, user)
     await session.commit()
+    entity_cache.invalidate(Task, task_id)
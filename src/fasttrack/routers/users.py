@@ -1,23 +1,26 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from fasttrack.auth.dependencies import AdminUser, CurrentUser
+from fasttrack.auth.principals import invalidate_principal
 from fasttrack.database import get_session
 from fasttrack.models.user import User
+from fasttrack.queries import USER_BY_ID
 from fasttrack.schemas.pagination import PaginatedResponse
 from fasttrack.schemas.user import UserAdminUpdate, UserRead, UserUpdate
 from fasttrack.utils.pagination import paginate
+from fasttrack.utils.serialization import FastJSONRoute, parse_fields, render, render_page
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=FastJSONRoute)
 
 
 @router.get("/me", response_model=UserRead)
-async def get_me(user: CurrentUser) -> User:
-    return user
+async def get_me(user: CurrentUser, fields: str | None = None) -> Response:
+    return render(user, UserRead, fields=parse_fields(fields, UserRead))
 
 
 @router.patch("/me", response_model=UserRead)
@@ -25,14 +28,15 @@ async def update_me(
     data: UserUpdate,
     user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
+) -> Response:
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(user, key, value)
     user.updated_at = datetime.utcnow()
+    user_id = user.id
     session.add(user)
     await session.commit()
-    await session.refresh(user)
-    return user
+    invalidate_principal(user_id)  # type: ignore[arg-type]
+    return render(user, UserRead)
 
 
 @router.get("", response_model=PaginatedResponse[UserRead])
@@ -41,9 +45,23 @@ async def list_users(
     session: Annotated[AsyncSession, Depends(get_session)],
     cursor: str | None = None,
     limit: int = 20,
-) -> PaginatedResponse:
+    sort: str = "id",
+    include_total: bool = False,
+    fields: str | None = None,
+) -> Response:
+    projection = parse_fields(fields, UserRead)
     query = select(User)
-    return await paginate(session, query, User, cursor=cursor, limit=limit)
+    page = await paginate(
+        session,
+        query,
+        User,
+        cursor=cursor,
+        limit=limit,
+        sort=sort,
+        include_total=include_total,
+        fields=projection,
+    )
+    return render_page(page, UserRead, fields=projection)
 
 
 @router.get("/{user_id}", response_model=UserRead)
@@ -51,29 +69,40 @@ async def get_user(
     user_id: int,
     admin: AdminUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
-    result = await session.execute(select(User).where(User.id == user_id))
+    fields: str | None = None,
+) -> Response:
+    projection = parse_fields(fields, UserRead)
+    result = await session.execute(USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return user
+    return render(user, UserRead, fields=projection)
 
 
-@router.patch("/{user_id}", response_model=UserRead)
+@router.patch(
+    "/{user_id}",
+    response_model=UserRead,
+    description=(
+        "Update a user. Deactivating revokes their tokens: refresh tokens at once, access "
+        "tokens on other workers within PRINCIPAL_CACHE_TTL seconds."
+    ),
+)
 async def admin_update_user(
     user_id: int,
     data: UserAdminUpdate,
     admin: AdminUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> User:
-    result = await session.execute(select(User).where(User.id == user_id))
+) -> Response:
+    result = await session.execute(USER_BY_ID, {"user_id": user_id})
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(user, key, value)
     user.updated_at = datetime.utcnow()
+    if data.is_active is False:
+        user.tokens_valid_after = user.updated_at
     session.add(user)
     await session.commit()
-    await session.refresh(user)
-    return user
+    invalidate_principal(user_id)
+    return render(user, UserRead)
@@ -5,3 +5,5 @@ class PaginatedResponse[T](BaseModel):
     items: list[T]
     next_cursor: str | None = None
     has_more: bool = False
+    total: int | None = None
+    total_estimated: bool = False
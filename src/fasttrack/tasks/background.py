@@ -1,7 +1,23 @@
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from fasttrack.auth.blocklist import cleanup_expired_tokens, sync_revocation_cache
+from fasttrack.auth.revocation import revocation_cache
+from fasttrack.config import get_settings
+from fasttrack.database import engine, open_session, read_engine
+from fasttrack.utils.entity_cache import entity_cache
 
 logger = logging.getLogger(__name__)
 
+sweep_stats: dict[str, int | float] = {
+    "runs": 0,
+    "purged_total": 0,
+    "last_purged": 0,
+    "last_duration_ms": 0.0,
+}
+
 
 async def send_assignment_email(task_title: str, assignee_email: str) -> None:
     logger.info("Email notification: Task '%s' assigned to %s", task_title, assignee_email)
@@ -9,3 +25,41 @@ async def send_assignment_email(task_title: str, assignee_email: str) -> None:
 
 async def update_project_stats(project_id: int) -> None:
     logger.info("Updating statistics for project %d", project_id)
+
+
+async def sync_revocations() -> None:
+    async with open_session(read_engine) as session:
+        await sync_revocation_cache(session)
+
+
+async def sync_entity_cache() -> None:
+    async with open_session(read_engine) as session:
+        dropped = await entity_cache.sync(session)
+    if dropped:
+        logger.info("Dropped %d entity cache entries written by other workers", dropped)
+
+
+async def sweep_blocked_tokens() -> None:
+    settings = get_settings()
+    started = time.perf_counter()
+    async with open_session(engine) as session:
+        purged = await cleanup_expired_tokens(session, settings.BLOCKLIST_SWEEP_CHUNK_SIZE)
+        if purged:
+            # Bloom filters cannot forget entries; rebuild from the rows that remain.
+            revocation_cache.invalidate()
+            await sync_revocation_cache(session)
+    duration_ms = (time.perf_counter() - started) * 1000
+    sweep_stats["runs"] += 1
+    sweep_stats["purged_total"] += purged
+    sweep_stats["last_purged"] = purged
+    sweep_stats["last_duration_ms"] = round(duration_ms, 2)
+    logger.info("Purged %d expired blocked tokens in %.1f ms", purged, duration_ms)
+
+
+async def run_periodically(interval: float, job: Callable[[], Awaitable[None]]) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception:
+            logger.exception("Periodic job %s failed", job.__name__)
@@ -0,0 +1,125 @@
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+
+class CacheBackend[K, V](Protocol):
+    # What the entity and response caches need; TTLCache is the in-process default.
+    def get(self, key: K) -> V | None: ...
+
+    def set(self, key: K, value: V) -> None: ...
+
+    def pop(self, key: K) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def items(self) -> list[tuple[K, V]]: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class TTLCache[K, V]:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def items(self) -> list[tuple[K, V]]:
+        return [(key, value) for key, (_, value) in self._data.items()]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+        }
+
+
+class ByteBudgetCache[K]:
+    # LRU over byte strings, bounded by their total size rather than their number.
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[K, bytes] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> bytes | None:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: bytes) -> None:
+        self.pop(key)
+        if len(value) > self.max_bytes:
+            return
+        self._data[key] = value
+        self.bytes += len(value)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self.bytes -= len(evicted)
+            self.evictions += 1
+
+    def pop(self, key: K) -> None:
+        value = self._data.pop(key, None)
+        if value is not None:
+            self.bytes -= len(value)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def items(self) -> list[tuple[K, bytes]]:
+        return list(self._data.items())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "bytes": self.bytes,
+        }
@@ -0,0 +1,83 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import Select, bindparam, func, literal_column
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, delete, select
+
+from fasttrack.config import get_settings
+from fasttrack.models.comment import Comment
+from fasttrack.models.counter import Counter
+from fasttrack.models.task import Task
+
+settings = get_settings()
+
+PROJECT_TASKS = "project_tasks"
+TASK_COMMENTS = "task_comments"
+# Change versions, bumped by every write that alters a list page's contents.
+PROJECT_VERSION = "project_version"
+TASK_VERSION = "task_version"
+OWNER_VERSION = "owner_version"
+# Row versions, bumped whenever the row itself changes; they validate cached entities.
+PROJECT_ROW_VERSION = "project_row_version"
+TASK_ROW_VERSION = "task_row_version"
+
+# Counters a newly inserted row bumps: scope name and the attribute holding its id.
+COUNTED_MODELS: dict[type[SQLModel], tuple[tuple[str, str], ...]] = {
+    Task: ((PROJECT_TASKS, "project_id"), (PROJECT_VERSION, "project_id")),
+    Comment: ((TASK_COMMENTS, "task_id"), (TASK_VERSION, "task_id")),
+}
+
+COUNTER_VALUE = select(Counter.value).where(
+    Counter.scope == bindparam("scope"), Counter.scope_id == bindparam("scope_id")
+)
+
+
+async def adjust_counter(session: AsyncSession, scope: str, scope_id: int, delta: int) -> None:
+    stmt = insert(Counter).values(scope=scope, scope_id=scope_id, value=delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Counter.scope, Counter.scope_id],
+        set_={"value": Counter.value + stmt.excluded.value},
+    )
+    await session.execute(stmt)
+
+
+async def count_inserted(session: AsyncSession, rows: Iterable[SQLModel]) -> None:
+    deltas: dict[tuple[str, int], int] = defaultdict(int)
+    for row in rows:
+        for scope, attr in COUNTED_MODELS.get(type(row), ()):
+            deltas[scope, getattr(row, attr)] += 1
+    for (scope, scope_id), delta in deltas.items():
+        await adjust_counter(session, scope, scope_id, delta)
+
+
+async def bump_version(session: AsyncSession, scope: str, scope_id: int) -> None:
+    await adjust_counter(session, scope, scope_id, 1)
+
+
+async def drop_counter(session: AsyncSession, scope: str, scope_id: int) -> None:
+    await session.execute(
+        delete(Counter).where(Counter.scope == scope, Counter.scope_id == scope_id)  # type: ignore[arg-type]
+    )
+
+
+async def read_counter(session: AsyncSession, scope: str, scope_id: int) -> int:
+    result = await session.execute(COUNTER_VALUE, {"scope": scope, "scope_id": scope_id})
+    # No row yet means nothing has been inserted in this scope.
+    return result.scalar_one_or_none() or 0
+
+
+async def estimate_count(session: AsyncSession, query: Select) -> tuple[int, bool]:
+    # Without a counter, count at most COUNT_ESTIMATE_CAP matching rows; hitting the cap
+    # makes the result a lower bound rather than an exact total.
+    cap = settings.COUNT_ESTIMATE_CAP
+    capped = (
+        query.with_only_columns(literal_column("1"), maintain_column_froms=True)
+        .order_by(None)
+        .limit(cap)
+        .subquery()
+    )
+    result = await session.execute(select(func.count()).select_from(capped))
+    count = result.scalar_one()
+    return count, count >= cap
@@ -0,0 +1,109 @@
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from itertools import batched
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel, select
+
+from fasttrack.config import get_settings
+from fasttrack.models.counter import Counter
+from fasttrack.models.project import Project
+from fasttrack.models.task import Task
+from fasttrack.utils.cache import CacheBackend, TTLCache
+from fasttrack.utils.counters import PROJECT_ROW_VERSION, TASK_ROW_VERSION
+
+settings = get_settings()
+
+ROW_VERSIONS: dict[type[SQLModel], str] = {
+    Project: PROJECT_ROW_VERSION,
+    Task: TASK_ROW_VERSION,
+}
+
+# Loaders return the row, extra data cached with it, and the row version read in the
+# same statement.
+type Loader[M: SQLModel] = Callable[[], Awaitable[tuple[M, Any, int] | None]]
+
+SYNC_CHUNK_SIZE = 500
+
+
+class EntityCache:
+    def __init__(self, backend: CacheBackend[tuple[str, int], tuple[int, dict, Any]]) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @staticmethod
+    def _key(model: type[SQLModel], record_id: int) -> tuple[str, int]:
+        return model.__tablename__, record_id  # type: ignore[return-value]
+
+    async def load[M: SQLModel](
+        self, session: AsyncSession, model: type[M], record_id: int, loader: Loader[M]
+    ) -> tuple[M, Any] | None:
+        # Hits cost no query. This worker's writes invalidate on commit; other workers'
+        # writes are caught by sync(), so a hit may be ENTITY_CACHE_SYNC_INTERVAL old.
+        key = self._key(model, record_id)
+        entry = self.backend.get(key)
+        if entry is not None:
+            self.hits += 1
+            _, data, extra = entry
+            instance = model(**data)
+            make_transient_to_detached(instance)
+            # merge() reuses an instance the session already holds, without a SELECT.
+            return await session.merge(instance, load=False), extra
+        self.misses += 1
+        loaded = await loader()
+        if loaded is None:
+            return None
+        instance, extra, version = loaded
+        self.backend.set(key, (version, instance.model_dump(), extra))
+        return instance, extra
+
+    async def sync(self, session: AsyncSession) -> int:
+        # Drops every entry whose row has been written since it was cached, reading the
+        # versions of all cached rows in a few bulk queries.
+        cached: dict[str, dict[int, int]] = defaultdict(dict)
+        for (table, record_id), (version, _, _) in self.backend.items():
+            cached[table][record_id] = version
+        dropped = 0
+        for model, scope in ROW_VERSIONS.items():
+            entries = cached.get(model.__tablename__, {})  # type: ignore[arg-type]
+            for chunk in batched(entries, SYNC_CHUNK_SIZE):
+                result = await session.execute(
+                    select(Counter.scope_id, Counter.value).where(
+                        Counter.scope == scope,
+                        Counter.scope_id.in_(chunk),  # type: ignore[attr-defined]
+                    )
+                )
+                current = dict(result.tuples().all())
+                for record_id in chunk:
+                    # A missing counter is version 0, as in the loaders' coalesce().
+                    if current.get(record_id, 0) != entries[record_id]:
+                        self.backend.pop(self._key(model, record_id))
+                        dropped += 1
+        self.stale += dropped
+        return dropped
+
+    def invalidate(self, model: type[SQLModel], record_id: int) -> None:
+        self.backend.pop(self._key(model, record_id))
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.hits = self.misses = self.stale = 0
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            **self.backend.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+entity_cache = EntityCache(
+    TTLCache(maxsize=settings.ENTITY_CACHE_SIZE, ttl=settings.ENTITY_CACHE_TTL)
+)
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, Response, status
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def resource_etag(record_id: int, updated_at: datetime) -> str:
+    return f'W/"{record_id}-{(updated_at - _EPOCH) // _MICROSECOND}"'
+
+
+def version_etag(scope: str, scope_id: int, version: int) -> str:
+    return f'W/"{scope}-{scope_id}-{version}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(tag) == target for tag in header.split(","))
+
+
+def precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Resource has been modified"
+    )
+
+
+def expected_updated_at(if_match: str | None, record_id: int) -> datetime | None:
+    # If-Match compares our weak tags too: they are exact updated_at stamps, not digests.
+    if if_match is None or if_match.strip() == "*":
+        return None
+    prefix = f'"{record_id}-'
+    for tag in if_match.split(","):
+        opaque = _opaque(tag)
+        if opaque.startswith(prefix) and opaque.endswith('"'):
+            try:
+                return _EPOCH + int(opaque[len(prefix) : -1]) * _MICROSECOND
+            except ValueError:
+                continue
+    raise precondition_failed()
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,100 @@
+import csv
+import enum
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+
+from sqlalchemy import Select, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fasttrack.config import get_settings
+from fasttrack.database import open_session
+from fasttrack.models.comment import Comment
+from fasttrack.models.task import Task
+from fasttrack.schemas.comment import CommentRead
+from fasttrack.schemas.task import TaskRead
+
+settings = get_settings()
+
+TASK_FIELDS = tuple(TaskRead.model_fields)
+COMMENT_FIELDS = tuple(CommentRead.model_fields)
+
+
+class ExportFormat(enum.StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv"}
+
+
+def export_query(project_id: int, include_comments: bool, after_id: int | None) -> Select:
+    # Plain columns rather than entities: rows stay tuples and never enter an identity map.
+    tasks = Task.__table__.c  # type: ignore[attr-defined]
+    query = select(*(tasks[name] for name in TASK_FIELDS)).where(tasks.project_id == project_id)
+    if after_id is not None:
+        query = query.where(tasks.id > after_id)
+    if not include_comments:
+        return query.order_by(tasks.id)
+    comments = Comment.__table__.c  # type: ignore[attr-defined]
+    return (
+        query.add_columns(*(comments[name].label(f"comment_{name}") for name in COMMENT_FIELDS))
+        .outerjoin(Comment.__table__, comments.task_id == tasks.id)
+        .order_by(tasks.id, comments.id)
+    )
+
+
+def _plain(value: object) -> object:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_lines(rows: Iterable[RowMapping], include_comments: bool, state: dict) -> list[str]:
+    lines = []
+    for row in rows:
+        if row["id"] != state.get("task_id"):
+            state["task_id"] = row["id"]
+            task = {name: _plain(row[name]) for name in TASK_FIELDS}
+            lines.append(json.dumps({"type": "task", **task}) + "\n")
+        if include_comments and row["comment_id"] is not None:
+            comment = {name: _plain(row[f"comment_{name}"]) for name in COMMENT_FIELDS}
+            lines.append(json.dumps({"type": "comment", **comment}) + "\n")
+    return lines
+
+
+async def stream_export(
+    bind: AsyncEngine,
+    project_id: int,
+    export_format: ExportFormat,
+    include_comments: bool = False,
+    after_id: int | None = None,
+) -> AsyncIterator[bytes]:
+    query = export_query(project_id, include_comments, after_id)
+    query = query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if export_format == ExportFormat.CSV:
+        header = list(TASK_FIELDS)
+        if include_comments:
+            header += [f"comment_{name}" for name in COMMENT_FIELDS]
+        writer.writerow(header)
+
+    state: dict = {}
+    # The request session is closed before the body is sent, so stream on our own.
+    async with open_session(bind) as session:
+        result = await session.stream(query)
+        async for partition in result.mappings().partitions():
+            if export_format == ExportFormat.CSV:
+                writer.writerows([_plain(value) for value in row.values()] for row in partition)
+            else:
+                buffer.writelines(_ndjson_lines(partition, include_comments, state))
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if tail := buffer.getvalue():
+        yield tail.encode()
@@ -0,0 +1,224 @@
+import asyncio
+import contextlib
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, bindparam, exists
+from sqlalchemy import insert as sa_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlmodel import SQLModel, insert, select
+
+from fasttrack.config import get_settings
+from fasttrack.database import engine, open_session
+from fasttrack.models.comment import Comment
+from fasttrack.models.project import Project
+from fasttrack.models.task import Task
+from fasttrack.utils.counters import count_inserted
+
+logger = logging.getLogger(__name__)
+
+# The request checked access to the parent, but the batch commits later in its own
+# transaction; rows of these models are only inserted while their parent still exists.
+PARENTS: dict[type[SQLModel], tuple[str, type[SQLModel]]] = {
+    Task: ("project_id", Project),
+    Comment: ("task_id", Task),
+}
+
+
+class ParentNotFound(LookupError):
+    def __init__(self, parent: type[SQLModel]) -> None:
+        super().__init__(f"{parent.__name__} not found")
+        self.parent = parent
+
+
+@cache
+def _guarded_insert(model: type[SQLModel]) -> Select:
+    # INSERT ... SELECT <values> WHERE EXISTS (parent): the check and the write are one
+    # statement, so a parent deleted by another worker can never end up with an orphan.
+    attr, parent = PARENTS[model]
+    table = model.__table__  # type: ignore[attr-defined]
+    names = [column.name for column in table.columns if column.name != "id"]
+    values = select(*(bindparam(name, type_=table.c[name].type) for name in names)).where(
+        exists().where(parent.id == bindparam(attr))  # type: ignore[attr-defined]
+    )
+    guarded = sa_insert(table).from_select(names, values).returning(*table.c)
+    # Core statement, ORM rows: the per-row params must not be read as bulk ORM values.
+    return select(model).from_statement(guarded)
+
+
+@dataclass(slots=True)
+class _PendingInsert:
+    row: SQLModel
+    future: asyncio.Future
+
+
+class GroupCommitWriter:
+    def __init__(self, bind: AsyncEngine, window_ms: float, max_batch: int) -> None:
+        self._bind = bind
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[_PendingInsert] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._collecting: list[_PendingInsert] = []
+        self._flushing: asyncio.Future | None = None  # type: ignore[type-arg]
+        self.batches = 0
+        self.rows = 0
+        self.largest_batch = 0
+        self.fallbacks = 0
+
+    async def add[M: SQLModel](self, row: M) -> M:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingInsert(row, future))
+        return await future
+
+    async def _collect(self) -> list[_PendingInsert]:
+        # Kept on the writer while filling, so close() can still flush what was dequeued.
+        batch = self._collecting = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window
+        while len(batch) < self._max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        self._collecting = []
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            # Shielded: cancelling the worker must not abandon a batch mid-commit.
+            self._flushing = asyncio.ensure_future(self._flush(batch))
+            try:
+                await asyncio.shield(self._flushing)
+            except Exception:
+                logger.exception("Group commit flush failed")
+
+    async def _flush(self, batch: list[_PendingInsert]) -> None:
+        try:
+            async with open_session(self._bind) as session:
+                created = await self._insert_batch(session, batch)
+                await session.commit()
+        except Exception:
+            # Replay row by row so a bad row fails only its own caller.
+            self.fallbacks += 1
+            for item in batch:
+                await self._flush_one(item)
+            return
+        self.batches += 1
+        self.rows += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for item, row in zip(batch, created, strict=True):
+            self._resolve(item, row)
+
+    @staticmethod
+    def _resolve(item: _PendingInsert, row: SQLModel | None) -> None:
+        if item.future.done():
+            return
+        if row is None:
+            item.future.set_exception(ParentNotFound(PARENTS[type(item.row)][1]))
+        else:
+            item.future.set_result(row)
+
+    async def _flush_one(self, item: _PendingInsert) -> None:
+        try:
+            async with open_session(self._bind) as session:
+                (row,) = await self._insert_batch(session, [item])
+                await session.commit()
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+            return
+        self.batches += 1
+        self.rows += 1
+        self._resolve(item, row)
+
+    async def _insert_batch(
+        self, session: AsyncSession, batch: list[_PendingInsert]
+    ) -> list[SQLModel | None]:
+        # None marks a row whose parent was deleted after the request checked it.
+        by_model: dict[type[SQLModel], list[int]] = defaultdict(list)
+        for index, item in enumerate(batch):
+            by_model[type(item.row)].append(index)
+        created: list[SQLModel | None] = [None] * len(batch)
+        for model, indexes in by_model.items():
+            params = [batch[i].row.model_dump(exclude={"id"}) for i in indexes]
+            if model in PARENTS:
+                # One guarded statement per row, still all inside the batch's single commit.
+                for index, values in zip(indexes, params, strict=True):
+                    result = await session.execute(_guarded_insert(model), values)
+                    created[index] = result.scalar_one_or_none()
+                continue
+            result = await session.execute(
+                insert(model).returning(model, sort_by_parameter_order=True), params
+            )
+            for index, row in zip(indexes, result.scalars().all(), strict=True):
+                created[index] = row
+        await count_inserted(session, [row for row in created if row is not None])
+        return created
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if self._flushing is not None:
+            with contextlib.suppress(Exception):
+                await self._flushing
+            self._flushing = None
+        # Rows the worker had dequeued but not yet flushed, then anything still queued.
+        pending, self._collecting = self._collecting, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            await self._flush(pending)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "largest_batch": self.largest_batch,
+            "fallbacks": self.fallbacks,
+            "queued": self._queue.qsize(),
+        }
+
+
+settings = get_settings()
+
+group_commit = GroupCommitWriter(
+    engine,
+    window_ms=settings.GROUP_COMMIT_WINDOW_MS,
+    max_batch=settings.GROUP_COMMIT_MAX_BATCH,
+)
+
+
+def get_group_commit() -> GroupCommitWriter | None:
+    return group_commit if settings.GROUP_COMMIT_ENABLED else None
+
+
+async def persist[M: SQLModel](
+    session: AsyncSession, row: M, writer: GroupCommitWriter | None
+) -> M:
+    if writer is None:
+        session.add(row)
+        await count_inserted(session, [row])
+        await session.commit()
+        return row
+    # Hand the writer connection back before queueing; the batch needs it to commit.
+    await session.close()
+    try:
+        return await writer.add(row)
+    except ParentNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from None
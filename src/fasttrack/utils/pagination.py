@@ -1,46 +1,190 @@
 import base64
-import json
+import binascii
+import enum
+import hashlib
+import hmac
+import struct
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 
-from sqlalchemy import Select
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from fasttrack.config import get_settings
 from fasttrack.schemas.pagination import PaginatedResponse
+from fasttrack.utils.counters import estimate_count, read_counter
+
+settings = get_settings()
 
 DEFAULT_PAGE_SIZE = 20
+CURSOR_VERSION = 1
+
+# version, sort fingerprint, number of key values; each value is a type tag plus payload,
+# and the whole token is followed by a truncated HMAC-SHA256.
+_HEADER = struct.Struct(">BIB")
+_INT = struct.Struct(">q")
+_STR_LEN = struct.Struct(">H")
+_SIGNATURE_SIZE = 12
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_SIGNING_KEY = hashlib.sha256(b"fasttrack-cursor:" + settings.SECRET_KEY.encode()).digest()
+
+
+@dataclass(frozen=True, slots=True)
+class SortOrder:
+    keys: tuple[str, ...]
+    descending: bool = False
+
+    @property
+    def fingerprint(self) -> int:
+        return zlib.crc32(f"{'-' if self.descending else '+'}{','.join(self.keys)}".encode())
+
+
+ID_ORDER = SortOrder(("id",))
+
+
+def parse_sort(sort: str, sortable: tuple[str, ...] = ("id",)) -> SortOrder:
+    descending = sort.startswith("-")
+    name = sort.lstrip("+-")
+    if name not in sortable:
+        raise ValueError(f"Unsupported sort: {sort}")
+    # id breaks ties so every key is unique and the keyset position is exact.
+    keys = (name,) if name == "id" else (name, "id")
+    return SortOrder(keys, descending)
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_SIGNING_KEY, payload, hashlib.sha256).digest()[:_SIGNATURE_SIZE]
 
 
-def encode_cursor(record_id: int) -> str:
-    return base64.urlsafe_b64encode(json.dumps({"id": record_id}).encode()).decode()
+def _pack_value(value: object) -> bytes:
+    if isinstance(value, int):
+        return b"i" + _INT.pack(value)
+    if isinstance(value, datetime):
+        return b"t" + _INT.pack((value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND)
+    if isinstance(value, str):
+        raw = str(value.value if isinstance(value, enum.Enum) else value).encode()
+        return b"s" + _STR_LEN.pack(len(raw)) + raw
+    raise TypeError(f"Unsupported cursor value: {type(value).__name__}")
 
 
-def decode_cursor(cursor: str) -> int:
+def _unpack_values(payload: bytes, offset: int, count: int) -> tuple:
+    values: list[object] = []
+    for _ in range(count):
+        tag = payload[offset : offset + 1]
+        offset += 1
+        if tag == b"i":
+            values.append(_INT.unpack_from(payload, offset)[0])
+            offset += _INT.size
+        elif tag == b"t":
+            values.append(_EPOCH + _INT.unpack_from(payload, offset)[0] * _MICROSECOND)
+            offset += _INT.size
+        elif tag == b"s":
+            (length,) = _STR_LEN.unpack_from(payload, offset)
+            offset += _STR_LEN.size
+            values.append(payload[offset : offset + length].decode())
+            offset += length
+        else:
+            raise ValueError("Invalid cursor")
+    if offset != len(payload):
+        raise ValueError("Invalid cursor")
+    return tuple(values)
+
+
+def encode_cursor(values: tuple | int, order: SortOrder = ID_ORDER) -> str:
+    if not isinstance(values, tuple):
+        values = (values,)
+    payload = _HEADER.pack(CURSOR_VERSION, order.fingerprint, len(values))
+    payload += b"".join(_pack_value(value) for value in values)
+    return base64.urlsafe_b64encode(payload + _sign(payload)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, order: SortOrder = ID_ORDER) -> tuple:
     try:
-        data = json.loads(base64.urlsafe_b64decode(cursor))
-        return int(data["id"])
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload, signature = raw[:-_SIGNATURE_SIZE], raw[-_SIGNATURE_SIZE:]
+        if len(payload) < _HEADER.size or not hmac.compare_digest(signature, _sign(payload)):
+            raise ValueError("Invalid cursor")
+        version, fingerprint, count = _HEADER.unpack_from(payload)
+        if version != CURSOR_VERSION or fingerprint != order.fingerprint:
+            raise ValueError("Invalid cursor")
+        if count != len(order.keys):
+            raise ValueError("Invalid cursor")
+        return _unpack_values(payload, _HEADER.size, count)
+    except (binascii.Error, struct.error, UnicodeDecodeError) as e:
         raise ValueError("Invalid cursor") from e
 
 
+def _coerce(column, value: object) -> object:  # noqa: ANN001
+    python_type = column.type.python_type
+    if isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+        return python_type(value)
+    return value
+
+
 async def paginate(
     session: AsyncSession,
     query: Select,
     model_class,  # noqa: ANN001
     cursor: str | None = None,
     limit: int = DEFAULT_PAGE_SIZE,
+    sort: str = "id",
+    sortable: tuple[str, ...] = ("id",),
+    include_total: bool = False,
+    counter: tuple[str, int] | None = None,
+    fields: tuple[str, ...] | None = None,
+    ranks: Mapping[str, tuple[ColumnElement[int], tuple[enum.Enum, ...]]] | None = None,
 ) -> PaginatedResponse:
-    if cursor:
-        last_id = decode_cursor(cursor)
-        query = query.where(model_class.id > last_id)
+    limit = max(1, min(limit, settings.PAGE_SIZE_MAX))
+    try:
+        order = parse_sort(sort, sortable)
+        position = decode_cursor(cursor, order) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    total, total_estimated = None, False
+    if include_total:
+        if counter is not None:
+            total = await read_counter(session, *counter)
+        else:
+            total, total_estimated = await estimate_count(session, query)
+
+    # Ranked keys sort by an expression; the cursor still carries the plain column value.
+    ranks = ranks or {}
+    columns = [ranks[key][0] if key in ranks else getattr(model_class, key) for key in order.keys]
+    if position is not None:
+        values = []
+        for key, value in zip(order.keys, position, strict=True):
+            value = _coerce(getattr(model_class, key), value)
+            values.append(ranks[key][1].index(value) if key in ranks else value)
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        bound = tuple(values) if len(columns) > 1 else values[0]
+        query = query.where(key < bound if order.descending else key > bound)
+
+    if fields is not None:
+        # Only the requested columns plus the sort keys the next cursor is built from.
+        names = dict.fromkeys((*fields, *order.keys))
+        query = query.with_only_columns(*(getattr(model_class, name) for name in names))
 
-    query = query.order_by(model_class.id).limit(limit + 1)
-    result = await session.execute(query)
-    rows = list(result.scalars().all())
+    query = query.order_by(*(col.desc() if order.descending else col for col in columns))
+    result = await session.execute(query.limit(limit + 1))
+    rows = list(result.all() if fields is not None else result.scalars().all())
 
     has_more = len(rows) > limit
     items = rows[:limit]
 
     next_cursor = None
     if has_more and items:
-        next_cursor = encode_cursor(items[-1].id)
+        last = items[-1]
+        next_cursor = encode_cursor(tuple(getattr(last, key) for key in order.keys), order)
 
-    return PaginatedResponse(items=items, next_cursor=next_cursor, has_more=has_more)
+    return PaginatedResponse(
+        items=items,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        total=total,
+        total_estimated=total_estimated,
+    )
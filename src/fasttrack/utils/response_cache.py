@@ -0,0 +1,39 @@
+from collections.abc import Hashable
+
+from fastapi import Response
+
+from fasttrack.config import get_settings
+from fasttrack.utils.cache import ByteBudgetCache, CacheBackend
+from fasttrack.utils.serialization import JSON_MEDIA_TYPE
+
+settings = get_settings()
+
+type PageKey = tuple[Hashable, ...]
+
+
+class ResponseCache:
+    # Keys embed the change version the page was rendered at. A write bumps the version,
+    # so old pages are never looked up again and simply age out of the LRU.
+    def __init__(self, backend: CacheBackend[PageKey, bytes]) -> None:
+        self.backend = backend
+
+    def get(self, key: PageKey, headers: dict[str, str] | None = None) -> Response | None:
+        content = self.backend.get(key)
+        if content is None:
+            return None
+        return Response(content, headers=headers, media_type=JSON_MEDIA_TYPE)
+
+    def store(self, key: PageKey, response: Response) -> Response:
+        self.backend.set(key, bytes(response.body))
+        return response
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        stats = self.backend.stats()
+        lookups = stats["hits"] + stats["misses"]
+        return {**stats, "hit_ratio": stats["hits"] / lookups if lookups else 0.0}
+
+
+response_cache = ResponseCache(ByteBudgetCache(settings.RESPONSE_CACHE_MAX_BYTES))
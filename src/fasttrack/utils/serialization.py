@@ -0,0 +1,121 @@
+import json
+from collections.abc import Callable, Coroutine
+from functools import cache
+from typing import Any, TypedDict
+
+import pydantic_core
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from fasttrack.schemas.pagination import PaginatedResponse
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@cache
+def response_adapter(model: type) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+@cache
+def schema_fields(schema: type[BaseModel]) -> dict[str, bool]:
+    return dict.fromkeys(schema.model_fields, True)
+
+
+@cache
+def _page_fields(schema: type[BaseModel]) -> dict[str, Any]:
+    fields: dict[str, Any] = schema_fields(PaginatedResponse)  # type: ignore[arg-type]
+    return {**fields, "items": {"__all__": schema_fields(schema)}}
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    # The read schema is the allowlist; the result is in schema order so it caches well.
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",")} - {""}
+    allowed = schema_fields(schema)
+    if not requested or requested - allowed.keys():
+        unknown = ", ".join(sorted(requested - allowed.keys())) or "none given"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported fields: {unknown}"
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+@cache
+def projection_page(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    item = TypedDict(  # type: ignore[misc]
+        f"{schema.__name__}Fields",
+        {name: schema.model_fields[name].annotation for name in fields},
+    )
+    return PaginatedResponse[item]  # type: ignore[valid-type]
+
+
+def dump_json(
+    obj: BaseModel, schema: type[BaseModel], fields: tuple[str, ...] | None = None
+) -> bytes:
+    # ORM rows are already valid; serialize them directly, limited to the schema's fields.
+    include = schema_fields(schema) if fields is None else set(fields)
+    return response_adapter(type(obj)).dump_json(obj, include=include)
+
+
+def render(
+    obj: BaseModel,
+    schema: type[BaseModel],
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Response:
+    content = dump_json(obj, schema, fields)
+    return Response(content, status_code=status_code, headers=headers, media_type=JSON_MEDIA_TYPE)
+
+
+def _dump_projection(
+    page: PaginatedResponse, schema: type[BaseModel], fields: tuple[str, ...]
+) -> bytes:
+    # Projected pages hold column rows, not entities; the typed page drops extra sort keys.
+    model = projection_page(schema, fields)
+    projected = model.model_construct(
+        items=[row._asdict() for row in page.items],
+        next_cursor=page.next_cursor,
+        has_more=page.has_more,
+        total=page.total,
+        total_estimated=page.total_estimated,
+    )
+    return response_adapter(model).dump_json(projected)
+
+
+def render_page(
+    page: PaginatedResponse,
+    schema: type[BaseModel],
+    headers: dict[str, str] | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Response:
+    if fields is None:
+        content = response_adapter(PaginatedResponse).dump_json(page, include=_page_fields(schema))
+    else:
+        content = _dump_projection(page, schema, fields)
+    return Response(content, headers=headers, media_type=JSON_MEDIA_TYPE)
+
+
+class FastJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            try:
+                self._json = pydantic_core.from_json(body)
+            except ValueError as e:
+                # FastAPI turns JSONDecodeError into its usual 422 response.
+                raise json.JSONDecodeError(str(e), body.decode(errors="replace"), 0) from e
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(FastJSONRequest(request.scope, request.receive))
+
+        return route_handler
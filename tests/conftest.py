@@ -1,19 +1,25 @@
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
 from fasttrack.auth.blocklist import BlockedToken  # noqa: F401
-from fasttrack.auth.jwt import create_access_token
+from fasttrack.auth.jwt import create_access_token, verified_token_cache
 from fasttrack.auth.password import hash_password
-from fasttrack.database import get_session
+from fasttrack.auth.principals import principal_cache
+from fasttrack.auth.revocation import revocation_cache
+from fasttrack.database import get_read_session, get_session, get_write_session
 from fasttrack.main import create_app
-from fasttrack.models import Comment, Project, Task, User  # noqa: F401
+from fasttrack.models import Comment, Counter, Project, Task, User  # noqa: F401
 from fasttrack.models.user import UserRole
+from fasttrack.utils.entity_cache import entity_cache
+from fasttrack.utils.response_cache import response_cache
 
 TEST_DB_URL = "sqlite+aiosqlite:///./test_fasttrack.db"
 
@@ -39,6 +45,30 @@ async def setup_db(test_engine):
         await conn.run_sync(SQLModel.metadata.drop_all)
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    revocation_cache.clear()
+    principal_cache.clear()
+    verified_token_cache.clear()
+    entity_cache.clear()
+    response_cache.clear()
+    yield
+
+
+@pytest.fixture
+def captured_statements(test_engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    # Every statement the test engine executes, with its parameters; executemany
+    # parameters arrive as a list. Clear it to start counting at a given point.
+    statements: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        statements.append((statement, parameters))
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+
 @pytest.fixture
 async def session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     async with SQLModelAsyncSession(test_engine, expire_on_commit=False) as session:
@@ -50,10 +80,12 @@ async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
     app = create_app()
 
     async def override_session() -> AsyncGenerator[AsyncSession, None]:
-        async with SQLModelAsyncSession(test_engine) as session:
+        async with SQLModelAsyncSession(test_engine, expire_on_commit=False) as session:
             yield session
 
     app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_read_session] = override_session
+    app.dependency_overrides[get_write_session] = override_session
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -110,3 +110,102 @@ async def test_invalid_token(client: AsyncClient):
         "/api/v1/users/me", headers={"Authorization": "Bearer invalid.token.here"}
     )
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_fails_fast_when_password_pool_full(
+    client: AsyncClient, test_user, monkeypatch
+):
+    from fasttrack.auth import password
+
+    monkeypatch.setattr(password, "password_executor", password.PasswordExecutor(1, 0))
+    resp = await client.post("/api/v1/auth/login", json={
+        "email": "test@example.com",
+        "password": "testpass123",
+    })
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    assert password.password_executor.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_password_pool_metrics(client: AsyncClient, test_user, admin_headers):
+    await client.post("/api/v1/auth/login", json={
+        "email": "test@example.com",
+        "password": "testpass123",
+    })
+    resp = await client.get("/metrics", headers=admin_headers)
+    pool = resp.json()["password_pool"]
+    assert pool["completed"] >= 1
+    assert pool["pending"] == 0
+
+
+def test_decode_token_cache_rechecks_expiry(monkeypatch):
+    import time
+    import types
+
+    from fasttrack.auth import jwt as jwt_module
+
+    token = jwt_module.create_access_token(1, "user")
+    claims = jwt_module.decode_token(token)
+    claims["sub"] = "tampered"
+    assert jwt_module.decode_token(token)["sub"] == "1"
+    assert jwt_module.verified_token_cache.hits == 1
+
+    later = time.time() + 3600
+    monkeypatch.setattr(jwt_module, "time", types.SimpleNamespace(time=lambda: later))
+    with pytest.raises(ValueError, match="expired"):
+        jwt_module.decode_token(token)
+
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_every_session(client: AsyncClient, test_user):
+    credentials = {"email": "test@example.com", "password": "testpass123"}
+    first = (await client.post("/api/v1/auth/login", json=credentials)).json()
+    second = (await client.post("/api/v1/auth/login", json=credentials)).json()
+    headers = {"Authorization": f"Bearer {first['access_token']}"}
+
+    resp = await client.post("/api/v1/auth/logout-all", headers=headers)
+    assert resp.status_code == 204
+
+    for tokens in (first, second):
+        resp = await client.get(
+            "/api/v1/users/me", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+        )
+        assert resp.status_code == 401
+        resp = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert resp.status_code == 401
+
+    fresh = (await client.post("/api/v1/auth/login", json=credentials)).json()
+    resp = await client.get(
+        "/api/v1/users/me", headers={"Authorization": f"Bearer {fresh['access_token']}"}
+    )
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cancelled_password_job_keeps_its_slot():
+    import asyncio
+    import threading
+
+    from fasttrack.auth.password import PasswordExecutor, PasswordPoolFull
+
+    executor = PasswordExecutor(workers=1, max_pending=1)
+    release = threading.Event()
+    job = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0.05)
+    job.cancel()
+    await asyncio.sleep(0)
+    # The bcrypt thread is still busy, so the slot is not handed out again.
+    assert executor.pending == 1
+    with pytest.raises(PasswordPoolFull):
+        await executor.run(lambda: None)
+    release.set()
+    for _ in range(100):
+        if executor.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.pending == 0
+    executor.shutdown()
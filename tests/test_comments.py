@@ -85,3 +85,32 @@ async def test_admin_can_delete_any_comment(
 
     resp = await client.delete(f"/api/v1/comments/{comment_id}", headers=admin_headers)
     assert resp.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_comment_total_tracks_deletes(client: AsyncClient, test_user, auth_headers):
+    task_id = await _setup_task(client, auth_headers)
+    url = f"/api/v1/tasks/{task_id}/comments"
+    ids = [
+        (await client.post(url, headers=auth_headers, json={"body": f"c{i}"})).json()["id"]
+        for i in range(3)
+    ]
+    await client.delete(f"/api/v1/comments/{ids[0]}", headers=auth_headers)
+
+    resp = await client.get(f"{url}?include_total=true&limit=1", headers=auth_headers)
+    assert resp.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_comment_list_etag(client: AsyncClient, test_user, auth_headers):
+    task_id = await _setup_task(client, auth_headers)
+    url = f"/api/v1/tasks/{task_id}/comments"
+    resp = await client.post(url, headers=auth_headers, json={"body": "one"})
+    comment_id = resp.json()["id"]
+
+    etag = (await client.get(url, headers=auth_headers)).headers["etag"]
+    conditional = {**auth_headers, "If-None-Match": etag}
+    assert (await client.get(url, headers=conditional)).status_code == 304
+    await client.delete(f"/api/v1/comments/{comment_id}", headers=auth_headers)
+    await client.post(url, headers=auth_headers, json={"body": "one"})
+    assert (await client.get(url, headers=conditional)).status_code == 200
@@ -0,0 +1,136 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from fasttrack.middleware.compression import CompressionMiddleware, skip_compression
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/text")
+    async def text() -> PlainTextResponse:
+        return PlainTextResponse("x" * 100)
+
+    @app.get("/secret")
+    @skip_compression
+    async def secret() -> PlainTextResponse:
+        return PlainTextResponse("token " * 100)
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"line {i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=50)
+    return app
+
+
+def _client(app: FastAPI) -> AsyncClient:
+    # httpx decodes the body transparently, so assertions see the original text.
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip;q=0, br;q=0.5, zstd", None),
+        ("gzip;q=0, *", None),
+        ("*;q=0, gzip", "gzip"),
+        ("*", "gzip"),
+        ("identity", None),
+    ],
+)
+def test_negotiation_honours_explicit_refusals(accept_encoding: str, expected: str | None):
+    middleware = CompressionMiddleware(_app(), minimum_size=0)
+    middleware.encoders = {"gzip": middleware.encoders["gzip"]}
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    assert middleware._negotiate(scope) == expected
+
+
+@pytest.mark.asyncio
+async def test_compresses_above_minimum_size_only():
+    async with _client(_app()) as client:
+        resp = await client.get("/text", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.text == "x" * 100
+
+        resp = await client.get("/text", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+
+
+@pytest.mark.asyncio
+async def test_opted_out_route_is_not_compressed():
+    async with _client(_app()) as client:
+        resp = await client.get("/secret", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+    assert resp.text == "token " * 100
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_flushed_per_chunk():
+    app = _app()
+    sent = []
+
+    requested = asyncio.Event()
+
+    async def receive():
+        if requested.is_set():
+            # The client stays connected until the stream is done.
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "root_path": "",
+        "scheme": "http",
+        "server": ("test", 80),
+        "http_version": "1.1",
+    }
+    await app(scope, receive, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    bodies = [message["body"] for message in sent[1:]]
+    assert all(bodies)
+    assert gzip.decompress(b"".join(bodies)) == b"line 0\nline 1\nline 2\n"
+
+
+@pytest.mark.asyncio
+async def test_large_list_is_compressed(client: AsyncClient, test_user, auth_headers):
+    resp = await client.post("/api/v1/projects", headers=auth_headers, json={"name": "Big"})
+    url = f"/api/v1/projects/{resp.json()['id']}/tasks"
+    for i in range(20):
+        await client.post(url, headers=auth_headers, json={"title": f"Task {i}" * 5})
+
+    resp = await client.get(f"{url}?limit=20", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(json.loads(resp.content)["items"]) == 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("module", "encoding"), [("brotli", "br"), ("zstandard", "zstd")])
+async def test_optional_encoders_are_preferred(module: str, encoding: str):
+    pytest.importorskip(module)
+    async with _client(_app()) as client:
+        resp = await client.get("/text", headers={"Accept-Encoding": f"gzip, {encoding}"})
+    assert resp.headers["content-encoding"] == encoding
@@ -0,0 +1,93 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from fasttrack.database import (
+    build_engine,
+    engine,
+    engine_for,
+    get_session,
+    open_session,
+    read_engine,
+    statement_cache_stats,
+)
+from fasttrack.models.user import User
+from fasttrack.queries import USER_BY_ID
+
+
+@pytest.mark.asyncio
+async def test_sqlite_profile_applied_to_connections(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+    async with engine.connect() as conn:
+        pragmas = {
+            name: (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "temp_store")
+        }
+    await engine.dispose()
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "busy_timeout": 5000,
+        "temp_store": 2,
+    }
+    assert engine.pool.size() == 5
+
+
+def test_engine_for_routes_reads_and_writes():
+    assert engine_for("GET") is read_engine
+    assert engine_for("HEAD") is read_engine
+    for method in ("POST", "PATCH", "PUT", "DELETE"):
+        assert engine_for(method) is engine
+    assert engine.pool.size() == 1
+
+
+@pytest.mark.asyncio
+async def test_read_only_engine_rejects_writes(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'split.db'}"
+    writer = build_engine(url, pool_size=1, max_overflow=0)
+    reader = build_engine(url, read_only=True)
+    async with writer.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    async with reader.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM t"))).scalar() == 1
+        with pytest.raises(OperationalError, match="readonly"):
+            await conn.execute(text("INSERT INTO t VALUES (2)"))
+    await writer.dispose()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_writer_queue_timeout_returns_503(client: AsyncClient, test_user, auth_headers):
+    async def busy_session():
+        raise PoolTimeoutError("QueuePool limit reached")
+        yield
+
+    client._transport.app.dependency_overrides[get_session] = busy_session  # type: ignore[union-attr]
+    resp = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_registered_statements_hit_compiled_cache(tmp_path):
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'cache.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.metadata.create_all)
+
+    async with open_session(engine) as session:
+        await session.execute(USER_BY_ID, {"user_id": 1})
+        before = statement_cache_stats.stats()
+        for user_id in range(2, 5):
+            await session.execute(USER_BY_ID, {"user_id": user_id})
+        after = statement_cache_stats.stats()
+    await engine.dispose()
+
+    assert after["hits"] - before["hits"] == 3
+    assert after["misses"] == before["misses"]
+    assert 0 < after["hit_ratio"] <= 1
+    assert engine.sync_engine._compiled_cache.capacity == 500
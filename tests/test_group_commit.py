@@ -0,0 +1,151 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from fasttrack.database import build_engine, get_session, open_session
+from fasttrack.main import create_app
+from fasttrack.models.comment import Comment
+from fasttrack.models.project import Project
+from fasttrack.models.task import Task
+from fasttrack.utils.counters import TASK_COMMENTS, read_counter
+from fasttrack.utils.group_commit import GroupCommitWriter, ParentNotFound, get_group_commit
+from tests.conftest import TEST_DB_URL
+
+
+async def _task(session: AsyncSession, owner_id: int) -> Task:
+    project = Project(name="Batch", owner_id=owner_id)
+    session.add(project)
+    await session.commit()
+    task = Task(title="Batch", project_id=project.id)  # type: ignore[arg-type]
+    session.add(task)
+    await session.commit()
+    return task
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inserts_share_one_commit(session, test_engine, test_user):
+    task = await _task(session, test_user.id)
+    writer = GroupCommitWriter(test_engine, window_ms=50, max_batch=64)
+
+    comments = await asyncio.gather(*[
+        writer.add(Comment(body=f"c{i}", task_id=task.id, author_id=test_user.id))
+        for i in range(10)
+    ])
+    await writer.close()
+
+    assert [c.body for c in comments] == [f"c{i}" for i in range(10)]
+    assert len({c.id for c in comments}) == 10
+    assert writer.batches == 1
+    assert writer.largest_batch == 10
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped(session, test_engine, test_user):
+    task = await _task(session, test_user.id)
+    writer = GroupCommitWriter(test_engine, window_ms=50, max_batch=2)
+
+    await asyncio.gather(*[
+        writer.add(Comment(body="c", task_id=task.id, author_id=test_user.id))
+        for _ in range(5)
+    ])
+    await writer.close()
+    assert writer.batches == 3
+
+
+@pytest.mark.asyncio
+async def test_failing_row_only_fails_its_caller(session, test_engine, test_user):
+    task = await _task(session, test_user.id)
+    writer = GroupCommitWriter(test_engine, window_ms=50, max_batch=64)
+
+    good, bad = await asyncio.gather(
+        writer.add(Comment(body="ok", task_id=task.id, author_id=test_user.id)),
+        writer.add(Comment(body=None, task_id=task.id, author_id=test_user.id)),  # type: ignore[arg-type]
+        return_exceptions=True,
+    )
+    await writer.close()
+
+    assert isinstance(good, Comment) and good.id is not None
+    assert isinstance(bad, IntegrityError)
+    assert writer.fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_comment_on_deleted_task_is_not_inserted(session, test_engine, test_user):
+    task = await _task(session, test_user.id)
+    task_id = task.id
+    # The request checked access, then the task went away before the batch committed.
+    await session.delete(task)
+    await session.commit()
+    writer = GroupCommitWriter(test_engine, window_ms=50, max_batch=64)
+
+    with pytest.raises(ParentNotFound):
+        await writer.add(Comment(body="late", task_id=task_id, author_id=test_user.id))
+    await writer.close()
+
+    comments = await session.execute(select(Comment).where(Comment.task_id == task_id))
+    assert comments.first() is None
+    assert await read_counter(session, TASK_COMMENTS, task_id) == 0  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_rows_already_dequeued(session, test_engine, test_user):
+    task = await _task(session, test_user.id)
+    writer = GroupCommitWriter(test_engine, window_ms=10_000, max_batch=64)
+
+    adds = [
+        asyncio.ensure_future(
+            writer.add(Comment(body=f"c{i}", task_id=task.id, author_id=test_user.id))
+        )
+        for i in range(3)
+    ]
+    # Let the worker pull them into its batch, well before the window closes.
+    await asyncio.sleep(0.05)
+    await writer.close()
+
+    comments = await asyncio.wait_for(asyncio.gather(*adds), timeout=1)
+    assert all(c.id is not None for c in comments)
+
+
+@pytest.fixture
+async def single_writer_client(test_engine) -> AsyncGenerator[AsyncClient, None]:
+    # Mirror production: requests and the batch writer share one write connection.
+    writer_engine = build_engine(TEST_DB_URL, pool_size=1, max_overflow=0, pool_timeout=2)
+    writer = GroupCommitWriter(writer_engine, window_ms=20, max_batch=64)
+    app = create_app()
+
+    async def override_session() -> AsyncGenerator[AsyncSession, None]:
+        async with open_session(writer_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_group_commit] = lambda: writer
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ac.writer = writer  # type: ignore[attr-defined]
+        yield ac
+    await writer.close()
+    await writer_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_routes_batch_comments(single_writer_client, session, test_user, auth_headers):
+    task = await _task(session, test_user.id)
+    responses = await asyncio.gather(*[
+        single_writer_client.post(
+            f"/api/v1/tasks/{task.id}/comments", headers=auth_headers, json={"body": f"{i}"}
+        )
+        for i in range(8)
+    ])
+
+    assert {r.status_code for r in responses} == {201}
+    assert len({r.json()["id"] for r in responses}) == 8
+    assert single_writer_client.writer.batches < 8  # type: ignore[attr-defined]
+
+    resp = await single_writer_client.get(
+        f"/api/v1/tasks/{task.id}/comments?include_total=true", headers=auth_headers
+    )
+    assert resp.json()["total"] == 8
@@ -1,12 +1,14 @@
+from datetime import datetime
+
 import pytest
 
-from fasttrack.utils.pagination import decode_cursor, encode_cursor
+from fasttrack.utils.pagination import decode_cursor, encode_cursor, parse_sort
 
 
 @pytest.mark.asyncio
 async def test_cursor_encode_decode():
     cursor = encode_cursor(42)
-    assert decode_cursor(cursor) == 42
+    assert decode_cursor(cursor) == (42,)
 
 
 @pytest.mark.asyncio
@@ -18,4 +20,32 @@ async def test_invalid_cursor():
 @pytest.mark.asyncio
 async def test_cursor_round_trip():
     for i in [1, 100, 999999]:
-        assert decode_cursor(encode_cursor(i)) == i
+        assert decode_cursor(encode_cursor(i)) == (i,)
+
+
+def test_composite_cursor_round_trip():
+    order = parse_sort("-updated_at", ("id", "updated_at"))
+    position = (datetime(2026, 3, 1, 12, 30, 15, 123456), 7)
+    assert order.keys == ("updated_at", "id") and order.descending
+    assert decode_cursor(encode_cursor(position, order), order) == position
+
+    order = parse_sort("priority", ("priority",))
+    assert decode_cursor(encode_cursor(("high", 3), order), order) == ("high", 3)
+
+
+def test_cursor_rejects_tampering_and_other_sorts():
+    order = parse_sort("updated_at", ("updated_at",))
+    cursor = encode_cursor((datetime(2026, 1, 1), 5), order)
+
+    tampered = cursor[:-2] + ("A" if cursor[-2] != "A" else "B") + cursor[-1]
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(tampered, order)
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, parse_sort("-updated_at", ("updated_at",)))
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_parse_sort_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="Unsupported sort"):
+        parse_sort("hashed_password")
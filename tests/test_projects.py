@@ -1,6 +1,12 @@
+import csv
+import io
+import json
+
 import pytest
 from httpx import AsyncClient
 
+from fasttrack.utils import export
+
 
 @pytest.mark.asyncio
 async def test_create_project(client: AsyncClient, test_user, auth_headers):
@@ -119,3 +125,115 @@ async def test_project_pagination(client: AsyncClient, test_user, auth_headers):
     )
     data2 = resp2.json()
     assert len(data2["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_project_writes_skip_post_commit_select(
+    client: AsyncClient, test_user, auth_headers, captured_statements
+):
+    resp = await client.post("/api/v1/projects", headers=auth_headers, json={"name": "A"})
+    assert resp.json()["created_at"]
+    resp = await client.patch(
+        f"/api/v1/projects/{resp.json()['id']}", headers=auth_headers, json={"name": "B"}
+    )
+    assert resp.json()["name"] == "B"
+    projects = [
+        statement.split()[0] for statement, _ in captured_statements if "projects" in statement
+    ]
+    assert projects == ["INSERT", "UPDATE"]
+
+
+async def _export_fixture(client: AsyncClient, headers: dict) -> tuple[int, list[int]]:
+    project_id = (
+        await client.post("/api/v1/projects", headers=headers, json={"name": "Export"})
+    ).json()["id"]
+    task_ids = []
+    for i in range(3):
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks", headers=headers, json={"title": f"T,{i}"}
+        )
+        task_ids.append(resp.json()["id"])
+    comments_url = f"/api/v1/tasks/{task_ids[1]}/comments"
+    for body in ("first", "second"):
+        await client.post(comments_url, headers=headers, json={"body": body})
+    return project_id, task_ids
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_tasks_and_comments(
+    client: AsyncClient, test_user, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(export.settings, "EXPORT_BATCH_SIZE", 2)
+    project_id, task_ids = await _export_fixture(client, auth_headers)
+
+    resp = await client.get(
+        f"/api/v1/projects/{project_id}/export?include_comments=true", headers=auth_headers
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [(r["type"], r["id"]) for r in records if r["type"] == "task"] == [
+        ("task", task_id) for task_id in task_ids
+    ]
+    assert [r["body"] for r in records if r["type"] == "comment"] == ["first", "second"]
+    assert records[2]["type"] == "comment" and records[1]["id"] == task_ids[1]
+
+    resp = await client.get(
+        f"/api/v1/projects/{project_id}/export?after_id={task_ids[0]}", headers=auth_headers
+    )
+    assert [json.loads(line)["id"] for line in resp.text.splitlines()] == task_ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_export_csv(client: AsyncClient, test_user, auth_headers):
+    project_id, task_ids = await _export_fixture(client, auth_headers)
+
+    resp = await client.get(
+        f"/api/v1/projects/{project_id}/export?format=csv&include_comments=true",
+        headers=auth_headers,
+    )
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [row["id"] for row in rows] == [str(task_ids[0])] + [str(task_ids[1])] * 2 + [
+        str(task_ids[2])
+    ]
+    assert rows[0]["title"] == "T,0" and rows[0]["comment_id"] == ""
+    assert rows[1]["status"] == "todo" and rows[2]["comment_body"] == "second"
+
+
+@pytest.mark.asyncio
+async def test_export_requires_ownership(client: AsyncClient, test_user, admin_headers):
+    project_id = (
+        await client.post("/api/v1/projects", headers=admin_headers, json={"name": "Admin"})
+    ).json()["id"]
+    from fasttrack.auth.jwt import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(test_user.id, test_user.role)}"}
+    resp = await client.get(f"/api/v1/projects/{project_id}/export", headers=headers)
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_project_etags(client: AsyncClient, test_user, auth_headers):
+    etag = (await client.get("/api/v1/projects", headers=auth_headers)).headers["etag"]
+    resp = await client.post("/api/v1/projects", headers=auth_headers, json={"name": "Tagged"})
+    project_url = f"/api/v1/projects/{resp.json()['id']}"
+    resp = await client.get("/api/v1/projects", headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    list_conditional = {**auth_headers, "If-None-Match": resp.headers["etag"]}
+    resp = await client.get("/api/v1/projects", headers=list_conditional)
+    assert resp.status_code == 304
+
+    etag = (await client.get(project_url, headers=auth_headers)).headers["etag"]
+    resp = await client.get(project_url, headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+    resp = await client.patch(
+        project_url, headers={**auth_headers, "If-Match": etag}, json={"name": "Renamed"}
+    )
+    assert resp.status_code == 200
+    resp = await client.patch(
+        project_url, headers={**auth_headers, "If-Match": etag}, json={"name": "Lost update"}
+    )
+    assert resp.status_code == 412
+    resp = await client.get("/api/v1/projects", headers=list_conditional)
+    assert resp.status_code == 200
@@ -0,0 +1,109 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fasttrack.auth.blocklist import cleanup_expired_tokens
+
+CHECKED_STATEMENTS = ("SELECT", "UPDATE", "DELETE")
+
+
+async def _exercise_routes(client: AsyncClient, headers: dict, admin_headers: dict) -> None:
+    resp = await client.post("/api/v1/projects", headers=headers, json={"name": "Plans"})
+    project_id = resp.json()["id"]
+    await client.get("/api/v1/projects", headers=headers)
+    await client.get("/api/v1/projects", headers=admin_headers)
+    await client.get(f"/api/v1/projects/{project_id}", headers=headers)
+    await client.patch(f"/api/v1/projects/{project_id}", headers=headers, json={"name": "P"})
+
+    task_ids = []
+    for i in range(3):
+        resp = await client.post(
+            f"/api/v1/projects/{project_id}/tasks", headers=headers, json={"title": f"T{i}"}
+        )
+        task_ids.append(resp.json()["id"])
+    tasks_url = f"/api/v1/projects/{project_id}/tasks"
+    resp = await client.get(f"{tasks_url}?limit=1", headers=headers)
+    await client.get(f"{tasks_url}?cursor={resp.json()['next_cursor']}", headers=headers)
+    await client.get(f"{tasks_url}?task_status=todo", headers=headers)
+    await client.get(f"{tasks_url}?include_total=true", headers=headers)
+    await client.get(f"{tasks_url}?include_total=true&priority=low", headers=headers)
+    await client.get(f"{tasks_url}?priority=high", headers=headers)
+    await client.get(f"{tasks_url}?assignee_id=1", headers=headers)
+    for sort in ("-id", "-updated_at", "priority", "-status"):
+        resp = await client.get(f"{tasks_url}?limit=1&sort={sort}", headers=headers)
+        cursor = resp.json()["next_cursor"]
+        await client.get(f"{tasks_url}?limit=1&sort={sort}&cursor={cursor}", headers=headers)
+
+    export_url = f"/api/v1/projects/{project_id}/export"
+    await client.get(f"{export_url}?after_id={task_ids[0]}", headers=headers)
+    await client.get(f"{export_url}?format=csv&include_comments=true", headers=headers)
+
+    task_id = task_ids[0]
+    await client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+    conditional = {**headers, "If-None-Match": 'W/"0"'}
+    await client.get(f"/api/v1/tasks/{task_id}", headers=conditional)
+    await client.get(f"/api/v1/projects/{project_id}", headers=conditional)
+    await client.patch(f"/api/v1/tasks/{task_id}", headers=headers, json={"status": "done"})
+
+    resp = await client.post(
+        f"/api/v1/tasks/{task_id}/comments", headers=headers, json={"body": "hi"}
+    )
+    await client.get(f"/api/v1/tasks/{task_id}/comments?include_total=true", headers=headers)
+    await client.delete(f"/api/v1/comments/{resp.json()['id']}", headers=headers)
+    await client.delete(f"/api/v1/tasks/{task_ids[1]}", headers=headers)
+
+    await client.get("/api/v1/users", headers=admin_headers)
+    await client.get("/api/v1/users/1", headers=admin_headers)
+    resp = await client.post("/api/v1/projects", headers=headers, json={"name": "Empty"})
+    await client.delete(f"/api/v1/projects/{resp.json()['id']}", headers=headers)
+
+    credentials = {"email": "test@example.com", "password": "testpass123"}
+    tokens = (await client.post("/api/v1/auth/login", json=credentials)).json()
+    await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    await client.post(
+        "/api/v1/auth/logout", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+
+
+def _full_scans(plan: list[str], statement: str) -> list[str]:
+    problems = [line for line in plan if "USE TEMP B-TREE FOR ORDER BY" in line]
+    # An unfiltered, LIMITed list (admin views) may walk the rowid order.
+    if re.search(r"\bWHERE\b", statement, re.IGNORECASE):
+        # Scanning a materialized LIMITed subquery is bounded; its own plan is checked too.
+        problems += [
+            line for line in plan if line.startswith("SCAN ") and not line.startswith("SCAN anon_")
+        ]
+    return problems
+
+
+@pytest.mark.asyncio
+async def test_router_queries_use_indexes(
+    client: AsyncClient,
+    session,
+    test_engine: AsyncEngine,
+    test_user,
+    admin_user,
+    auth_headers,
+    admin_headers,
+    captured_statements,
+):
+    await _exercise_routes(client, auth_headers, admin_headers)
+    await cleanup_expired_tokens(session)
+    checked = [
+        (statement, tuple(parameters))
+        for statement, parameters in captured_statements
+        if statement.lstrip().upper().startswith(CHECKED_STATEMENTS)
+        and not isinstance(parameters, list)
+    ]
+    assert len(checked) > 20
+
+    failures = []
+    async with test_engine.connect() as conn:
+        for statement, parameters in dict.fromkeys(checked):
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan = [row[3] for row in result]
+            if problems := _full_scans(plan, statement):
+                failures.append(f"{' '.join(statement.split())}\n    {problems}")
+    assert not failures, "Queries without a usable index:\n" + "\n".join(failures)
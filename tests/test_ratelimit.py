@@ -54,3 +54,97 @@ async def test_rate_limit_enforcement():
 
     if os.path.exists("test_ratelimit.db"):
         os.remove("test_ratelimit.db")
+
+
+def test_gcra_allows_burst_then_spaces_requests():
+    from fasttrack.middleware.ratelimit import GCRALimiter
+
+    limiter = GCRALimiter(max_requests=5, window=10)
+    assert [limiter.acquire("ip:a", now=100.0) for _ in range(5)] == [0.0] * 5
+    assert limiter.acquire("ip:a", now=100.0) == pytest.approx(2.0)
+    assert limiter.acquire("ip:b", now=100.0) == 0.0
+    # One request's worth of allowance comes back every window / max_requests seconds.
+    assert limiter.acquire("ip:a", now=102.0) == 0.0
+    assert limiter.acquire("ip:a", now=102.0) > 0
+
+
+def test_gcra_evicts_idle_keys():
+    from fasttrack.middleware.ratelimit import GCRALimiter
+
+    limiter = GCRALimiter(max_requests=5, window=10)
+    for i in range(1000):
+        limiter.acquire(f"ip:{i}", now=100.0)
+    assert len(limiter) == 1000
+    limiter.acquire("ip:late", now=111.0)
+    assert len(limiter) == 1
+    assert limiter.evictions == 1000
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_returns_429_before_routing(monkeypatch):
+    from fasttrack.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "RATE_LIMIT_REQUESTS", 3)
+    app = create_app()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        statuses = [(await client.get("/api/v1/missing")).status_code for _ in range(4)]
+        assert statuses == [404, 404, 404, 429]
+        resp = await client.get("/api/v1/missing")
+        assert resp.json() == {"detail": "Too many requests"}
+        assert int(resp.headers["retry-after"]) >= 1
+        assert (await client.get("/health")).status_code == 200
+
+
+def test_sqlite_limiter_is_shared_between_instances(tmp_path):
+    from fasttrack.middleware.ratelimit import SQLiteLimiter
+
+    path = str(tmp_path / "limits.db")
+    # Two instances stand in for two worker processes.
+    first, second = SQLiteLimiter(path, 4, 10), SQLiteLimiter(path, 4, 10)
+    try:
+        allowed = [
+            limiter.acquire("ip:a", now=100.0) for limiter in (first, second, first, second)
+        ]
+        assert allowed == [0.0] * 4
+        assert second.acquire("ip:a", now=100.0) == pytest.approx(2.5)
+        assert first.acquire("ip:a", now=102.5) == 0.0
+
+        assert first.acquire("ip:b", now=100.0) == 0.0
+        second.sweep(200.0)
+        assert len(first) == 0 and second.evictions == 2
+    finally:
+        first.close()
+        second.close()
+
+
+@pytest.mark.asyncio
+async def test_locked_sqlite_limiter_falls_back_to_local_limits(tmp_path):
+    import sqlite3
+
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse
+
+    from fasttrack.middleware.ratelimit import RateLimitMiddleware, SQLiteLimiter
+
+    path = str(tmp_path / "limits.db")
+    limiter = SQLiteLimiter(path, 2, 10)
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    # Another worker holds the write lock for the whole test.
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            statuses = [(await client.get("/ping")).status_code for _ in range(3)]
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+        limiter.close()
+    assert statuses == [200, 200, 429]
+    assert limiter.fallbacks == 3
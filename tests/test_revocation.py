@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from fasttrack.auth.blocklist import (
+    BlockedToken,
+    block_token,
+    cleanup_expired_tokens,
+    is_blocked,
+    sync_revocation_cache,
+)
+from fasttrack.auth.revocation import BloomFilter, revocation_cache
+
+
+def test_bloom_filter_membership():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+    assert all(f"jti-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_skips_database(session: AsyncSession):
+    await sync_revocation_cache(session)
+    assert revocation_cache.ready
+
+    assert await is_blocked(session, "never-revoked") is False
+    assert revocation_cache.hits == 1
+    assert revocation_cache.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_block_token_updates_cache(session: AsyncSession):
+    await sync_revocation_cache(session)
+    await block_token(session, "revoked-jti", datetime.utcnow() + timedelta(minutes=5))
+
+    assert await is_blocked(session, "revoked-jti") is True
+    assert revocation_cache.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_cold_cache_falls_back_to_database(session: AsyncSession):
+    session.add(BlockedToken(jti="from-db", expires_at=datetime.utcnow()))
+    await session.commit()
+
+    assert await is_blocked(session, "from-db") is True
+    assert revocation_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_rows_from_other_workers(session: AsyncSession):
+    await sync_revocation_cache(session)
+    session.add(BlockedToken(jti="other-worker", expires_at=datetime.utcnow()))
+    await session.commit()
+
+    await sync_revocation_cache(session)
+    assert await is_blocked(session, "other-worker") is True
+
+
+@pytest.mark.asyncio
+async def test_sync_sees_revocations_after_another_worker_purges(session: AsyncSession):
+    past = datetime.utcnow() - timedelta(minutes=1)
+    for i in range(5):
+        session.add(BlockedToken(jti=f"expired-{i}", expires_at=past))
+    await session.commit()
+    await sync_revocation_cache(session)
+    synced_id = revocation_cache.last_id
+
+    # Another worker sweeps everything; this one purged nothing, so it does not rebuild.
+    assert await cleanup_expired_tokens(session) == 5
+    fresh = BlockedToken(jti="fresh", expires_at=datetime.utcnow() + timedelta(minutes=5))
+    session.add(fresh)
+    await session.commit()
+    assert fresh.id > synced_id  # type: ignore[operator]
+
+    await sync_revocation_cache(session)
+    assert await is_blocked(session, "fresh") is True
+
+
+@pytest.mark.asyncio
+async def test_rebuild_of_empty_table_resets_last_id(session: AsyncSession):
+    session.add(BlockedToken(jti="old", expires_at=datetime.utcnow() - timedelta(minutes=1)))
+    await session.commit()
+    await sync_revocation_cache(session)
+    assert revocation_cache.last_id > 0
+
+    await cleanup_expired_tokens(session)
+    revocation_cache.invalidate()
+    await sync_revocation_cache(session)
+    assert revocation_cache.last_id == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_expose_revocation_cache(client: AsyncClient, admin_headers, auth_headers):
+    assert (await client.get("/metrics")).status_code == 403
+    assert (await client.get("/metrics", headers=auth_headers)).status_code == 403
+    resp = await client.get("/metrics", headers=admin_headers)
+    assert resp.status_code == 200
+    assert set(resp.json()["revocation_cache"]) >= {"hits", "misses", "false_positives"}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_purges_expired_in_chunks(session: AsyncSession):
+    past = datetime.utcnow() - timedelta(minutes=1)
+    future = datetime.utcnow() + timedelta(minutes=5)
+    for i in range(7):
+        session.add(BlockedToken(jti=f"expired-{i}", expires_at=past))
+    session.add(BlockedToken(jti="live", expires_at=future))
+    await session.commit()
+
+    assert await cleanup_expired_tokens(session, chunk_size=3) == 7
+    remaining = (await session.execute(select(BlockedToken.jti))).scalars().all()
+    assert remaining == ["live"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_rechecks_database_despite_warm_cache(
+    client: AsyncClient, session: AsyncSession, test_user
+):
+    from fasttrack.auth.jwt import decode_token
+
+    resp = await client.post(
+        "/api/v1/auth/login", json={"email": "test@example.com", "password": "testpass123"}
+    )
+    refresh_token = resp.json()["refresh_token"]
+    await sync_revocation_cache(session)
+
+    # Revoked by another worker: this process's filter has not seen it yet.
+    jti = decode_token(refresh_token)["jti"]
+    session.add(BlockedToken(jti=jti, expires_at=datetime.utcnow() + timedelta(days=1)))
+    await session.commit()
+    assert await is_blocked(session, jti) is False
+
+    resp = await client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+    assert resp.status_code == 401
+    assert await block_token(session, jti, datetime.utcnow()) is False
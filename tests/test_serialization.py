@@ -0,0 +1,45 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from fasttrack.models.user import User
+from fasttrack.schemas.pagination import PaginatedResponse
+from fasttrack.schemas.task import TaskRead
+from fasttrack.schemas.user import UserRead
+from fasttrack.utils.serialization import dump_json, render_page
+
+
+def test_dump_json_matches_schema_fields():
+    user = User(id=1, email="a@example.com", hashed_password="secret", display_name="A")
+    data = json.loads(dump_json(user, UserRead))
+    assert data == json.loads(UserRead.model_validate(user.model_dump()).model_dump_json())
+    assert "hashed_password" not in data
+
+
+@pytest.mark.asyncio
+async def test_page_matches_validated_response(client: AsyncClient, test_user, auth_headers):
+    resp = await client.post("/api/v1/projects", headers=auth_headers, json={"name": "Fast"})
+    project_id = resp.json()["id"]
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i in range(3):
+        await client.post(url, headers=auth_headers, json={"title": f"T{i}", "priority": "high"})
+
+    resp = await client.get(f"{url}?limit=2", headers=auth_headers)
+    assert resp.headers["content-type"] == "application/json"
+    validated = PaginatedResponse[TaskRead].model_validate(resp.json())
+    assert resp.json() == json.loads(validated.model_dump_json())
+    assert render_page(PaginatedResponse(items=[]), TaskRead).body == (
+        b'{"items":[],"next_cursor":null,"has_more":false,"total":null,"total_estimated":false}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_malformed_json_body_is_422(client: AsyncClient, test_user, auth_headers):
+    resp = await client.post(
+        "/api/v1/projects",
+        headers={**auth_headers, "Content-Type": "application/json"},
+        content=b'{"name": ',
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "json_invalid"
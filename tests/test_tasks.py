@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from fasttrack.utils import counters, pagination
+
 
 async def _create_project(client: AsyncClient, headers: dict) -> int:
     resp = await client.post(
@@ -118,3 +120,392 @@ async def test_task_filter_by_status(client: AsyncClient, test_user, auth_header
 async def test_task_not_found(client: AsyncClient, test_user, auth_headers):
     resp = await client.get("/api/v1/tasks/99999", headers=auth_headers)
     assert resp.status_code == 404
+
+
+async def _other_user_headers(session) -> dict[str, str]:
+    from fasttrack.auth.jwt import create_access_token
+    from fasttrack.models.user import User
+
+    other = User(email="other@example.com", hashed_password="x", display_name="Other")
+    session.add(other)
+    await session.commit()
+    await session.refresh(other)
+    return {"Authorization": f"Bearer {create_access_token(other.id, other.role)}"}
+
+
+@pytest.mark.asyncio
+async def test_task_mutations_enforce_access(
+    client: AsyncClient, session, test_user, auth_headers
+):
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", headers=auth_headers, json={"title": "Mine"}
+    )
+    task_id = resp.json()["id"]
+    other_headers = await _other_user_headers(session)
+
+    resp = await client.patch(
+        f"/api/v1/tasks/{task_id}", headers=other_headers, json={"title": "Hijacked"}
+    )
+    assert resp.status_code == 403
+    resp = await client.delete(f"/api/v1/tasks/{task_id}", headers=other_headers)
+    assert resp.status_code == 403
+    resp = await client.patch("/api/v1/tasks/99999", headers=auth_headers, json={"title": "x"})
+    assert resp.status_code == 404
+    resp = await client.delete("/api/v1/tasks/99999", headers=auth_headers)
+    assert resp.status_code == 404
+
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.json()["title"] == "Mine"
+
+
+@pytest.mark.asyncio
+async def test_assignee_can_update_task(client: AsyncClient, session, test_user, auth_headers):
+    other_headers = await _other_user_headers(session)
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks",
+        headers=auth_headers,
+        json={"title": "Assigned", "assignee_id": test_user.id + 1},
+    )
+    task_id = resp.json()["id"]
+
+    resp = await client.patch(
+        f"/api/v1/tasks/{task_id}", headers=other_headers, json={"status": "in_progress"}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "in_progress"
+
+
+@pytest.mark.asyncio
+async def test_get_task_loads_task_and_permission_in_one_query(
+    client: AsyncClient, session, test_user, auth_headers, captured_statements
+):
+    from fasttrack.auth.blocklist import sync_revocation_cache
+
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", headers=auth_headers, json={"title": "One"}
+    )
+    task_id = resp.json()["id"]
+    # The running app keeps the revocation filter warm, so tokens are checked in memory.
+    await sync_revocation_cache(session)
+
+    captured_statements.clear()
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.status_code == 200
+    assert len(captured_statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_task_removes_its_comments(
+    client: AsyncClient, session, test_user, auth_headers
+):
+    from sqlmodel import func, select
+
+    from fasttrack.models.comment import Comment
+
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", headers=auth_headers, json={"title": "Chatty"}
+    )
+    task_id = resp.json()["id"]
+    await client.post(
+        f"/api/v1/tasks/{task_id}/comments", headers=auth_headers, json={"body": "a"}
+    )
+
+    resp = await client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.status_code == 204
+    remaining = await session.execute(
+        select(func.count()).select_from(Comment).where(Comment.task_id == task_id)
+    )
+    assert remaining.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_task_keyset_sorts(client: AsyncClient, test_user, auth_headers):
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i, priority in enumerate(["low", "high", "medium", "high", "low"]):
+        resp = await client.post(
+            url, headers=auth_headers, json={"title": f"T{i}", "priority": priority}
+        )
+        if i % 2:
+            status = "done" if i == 1 else "in_progress"
+            await client.patch(
+                f"/api/v1/tasks/{resp.json()['id']}", headers=auth_headers, json={"status": status}
+            )
+
+    for sort in ("-id", "priority", "-priority", "-updated_at", "status"):
+        seen, cursor = [], None
+        while True:
+            params = {"sort": sort, "limit": 2} | ({"cursor": cursor} if cursor else {})
+            page = (await client.get(url, headers=auth_headers, params=params)).json()
+            seen += page["items"]
+            cursor = page["next_cursor"]
+            if not page["has_more"]:
+                break
+        field, reverse = sort.lstrip("-"), sort.startswith("-")
+        assert len(seen) == 5
+        # Enum columns order by declaration rank: low < medium < high, todo < ... < done.
+        ranks = {"priority": ["low", "medium", "high"], "status": ["todo", "in_progress", "done"]}
+        key = [
+            (ranks[field].index(t[field]) if field in ranks else t[field], t["id"]) for t in seen
+        ]
+        assert key == sorted(key, reverse=reverse), sort
+
+
+@pytest.mark.asyncio
+async def test_task_list_rejects_bad_sort_and_cursor(client: AsyncClient, test_user, auth_headers):
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i in range(3):
+        await client.post(url, headers=auth_headers, json={"title": f"T{i}"})
+
+    resp = await client.get(f"{url}?sort=title", headers=auth_headers)
+    assert resp.status_code == 400
+    cursor = (await client.get(f"{url}?limit=1", headers=auth_headers)).json()["next_cursor"]
+    resp = await client.get(f"{url}?cursor={cursor}&sort=-id", headers=auth_headers)
+    assert resp.status_code == 400
+    resp = await client.get(f"{url}?cursor=garbage", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_list_limit_is_capped(
+    client: AsyncClient, test_user, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(pagination.settings, "PAGE_SIZE_MAX", 2)
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i in range(3):
+        await client.post(url, headers=auth_headers, json={"title": f"T{i}"})
+
+    page = (await client.get(f"{url}?limit=1000", headers=auth_headers)).json()
+    assert len(page["items"]) == 2
+    assert page["has_more"] is True
+
+
+@pytest.mark.asyncio
+async def test_task_totals_follow_creates_and_deletes(
+    client: AsyncClient, test_user, auth_headers
+):
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    ids = []
+    for i, status in enumerate(["todo", "done", "done"]):
+        resp = await client.post(url, headers=auth_headers, json={"title": f"T{i}"})
+        ids.append(resp.json()["id"])
+        await client.patch(
+            f"/api/v1/tasks/{ids[-1]}", headers=auth_headers, json={"status": status}
+        )
+    await client.delete(f"/api/v1/tasks/{ids[0]}", headers=auth_headers)
+
+    page = (await client.get(f"{url}?include_total=true&limit=1", headers=auth_headers)).json()
+    assert page["total"] == 2
+    assert page["total_estimated"] is False
+    resp = await client.get(f"{url}?include_total=true&task_status=done", headers=auth_headers)
+    page = resp.json()
+    assert page["total"] == 2
+    assert (await client.get(url, headers=auth_headers)).json()["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_filtered_total_is_capped_estimate(
+    client: AsyncClient, test_user, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(counters.settings, "COUNT_ESTIMATE_CAP", 2)
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i in range(3):
+        await client.post(url, headers=auth_headers, json={"title": f"T{i}"})
+
+    resp = await client.get(f"{url}?include_total=true&task_status=todo", headers=auth_headers)
+    page = resp.json()
+    assert (page["total"], page["total_estimated"]) == (2, True)
+    page = (await client.get(f"{url}?include_total=true", headers=auth_headers)).json()
+    assert (page["total"], page["total_estimated"]) == (3, False)
+
+
+@pytest.mark.asyncio
+async def test_task_etags_and_conditional_requests(client: AsyncClient, test_user, auth_headers):
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", headers=auth_headers, json={"title": "Poll"}
+    )
+    task_url = f"/api/v1/tasks/{resp.json()['id']}"
+
+    etag = (await client.get(task_url, headers=auth_headers)).headers["etag"]
+    assert etag.startswith('W/"')
+    resp = await client.get(task_url, headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    resp = await client.patch(
+        task_url, headers={**auth_headers, "If-Match": etag}, json={"status": "done"}
+    )
+    assert resp.status_code == 200
+    new_etag = resp.headers["etag"]
+    assert new_etag != etag
+    resp = await client.patch(
+        task_url, headers={**auth_headers, "If-Match": etag}, json={"status": "todo"}
+    )
+    assert resp.status_code == 412
+    resp = await client.get(task_url, headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "done"
+
+
+@pytest.mark.asyncio
+async def test_task_list_etag_tracks_project_changes(client: AsyncClient, test_user, auth_headers):
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    resp = await client.post(url, headers=auth_headers, json={"title": "A"})
+    task_url = f"/api/v1/tasks/{resp.json()['id']}"
+
+    etag = (await client.get(url, headers=auth_headers)).headers["etag"]
+    resp = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+    seen = {etag}
+    for change in (
+        client.patch(task_url, headers=auth_headers, json={"title": "B"}),
+        client.post(url, headers=auth_headers, json={"title": "C"}),
+        client.delete(task_url, headers=auth_headers),
+    ):
+        await change
+        resp = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+        assert etag not in seen
+        seen.add(etag)
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_still_checks_access(
+    client: AsyncClient, test_user, admin_headers, auth_headers
+):
+    resp = await client.post("/api/v1/projects", headers=admin_headers, json={"name": "Admin"})
+    resp = await client.post(
+        f"/api/v1/projects/{resp.json()['id']}/tasks", headers=admin_headers, json={"title": "X"}
+    )
+    task_url = f"/api/v1/tasks/{resp.json()['id']}"
+    etag = (await client.get(task_url, headers=admin_headers)).headers["etag"]
+
+    resp = await client.get(task_url, headers={**auth_headers, "If-None-Match": etag})
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_task_sparse_fieldsets(
+    client: AsyncClient, test_user, auth_headers, captured_statements
+):
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    for i in range(3):
+        await client.post(url, headers=auth_headers, json={"title": f"T{i}", "description": "x"})
+
+    captured_statements.clear()
+    params = {"fields": "title,id,status", "limit": 2, "sort": "-updated_at"}
+    page = (await client.get(url, headers=auth_headers, params=params)).json()
+    assert [list(item) for item in page["items"]] == [["id", "title", "status"]] * 2
+    assert not any("tasks.description" in statement for statement, _ in captured_statements)
+
+    params |= {"cursor": page["next_cursor"]}
+    rest = (await client.get(url, headers=auth_headers, params=params)).json()
+    assert [item["title"] for item in page["items"] + rest["items"]] == ["T2", "T1", "T0"]
+
+    task_id = page["items"][0]["id"]
+    resp = await client.get(f"/api/v1/tasks/{task_id}?fields=priority", headers=auth_headers)
+    assert resp.json() == {"priority": "medium"}
+
+    for fields in ("title,secret", ""):
+        resp = await client.get(url, headers=auth_headers, params={"fields": fields})
+        assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_reads_served_from_entity_cache(
+    client: AsyncClient, session, test_user, auth_headers, captured_statements
+):
+    from sqlmodel import update
+
+    from fasttrack.auth.blocklist import sync_revocation_cache
+    from fasttrack.models.task import Task
+    from fasttrack.utils.entity_cache import entity_cache
+
+    project_id = await _create_project(client, auth_headers)
+    resp = await client.post(
+        f"/api/v1/projects/{project_id}/tasks", headers=auth_headers, json={"title": "Hot"}
+    )
+    task_id = resp.json()["id"]
+    # Warm every per-request cache, as the running app would be.
+    await sync_revocation_cache(session)
+    await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+
+    captured_statements.clear()
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.json()["title"] == "Hot"
+    assert captured_statements == []
+
+    # Another worker's write: served from cache until the next sync drops the copy.
+    await session.execute(update(Task).where(Task.id == task_id).values(title="Moved"))
+    await counters.bump_version(session, counters.TASK_ROW_VERSION, task_id)
+    await session.commit()
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.json()["title"] == "Hot"
+    assert await entity_cache.sync(session) == 1
+    captured_statements.clear()
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.json()["title"] == "Moved"
+    assert len(captured_statements) == 1
+
+    resp = await client.patch(
+        f"/api/v1/tasks/{task_id}", headers=auth_headers, json={"title": "Patched"}
+    )
+    resp = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert resp.json()["title"] == "Patched"
+    stats = entity_cache.stats()
+    assert stats["hits"] >= 1 and stats["stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_task_list_pages_served_from_response_cache(
+    client: AsyncClient, session, test_user, auth_headers, captured_statements
+):
+    from fasttrack.auth.blocklist import sync_revocation_cache
+    from fasttrack.utils.response_cache import response_cache
+
+    project_id = await _create_project(client, auth_headers)
+    url = f"/api/v1/projects/{project_id}/tasks"
+    await client.post(url, headers=auth_headers, json={"title": "First"})
+    await sync_revocation_cache(session)
+    first = await client.get(url, headers=auth_headers, params={"limit": 5})
+
+    captured_statements.clear()
+    again = await client.get(url, headers=auth_headers, params={"limit": 5})
+    # Only the list's change version is read, to build the cache key.
+    assert [statement.split("\n")[1] for statement, _ in captured_statements] == [
+        "FROM counters "
+    ]
+    assert again.content == first.content
+    assert again.headers["etag"] == first.headers["etag"]
+    assert response_cache.stats()["hits"] == 1
+
+    await client.post(url, headers=auth_headers, json={"title": "Second"})
+    fresh = await client.get(url, headers=auth_headers, params={"limit": 5})
+    assert [t["title"] for t in fresh.json()["items"]] == ["First", "Second"]
+
+
+def test_byte_budget_cache_evicts_least_recently_used():
+    from fasttrack.utils.cache import ByteBudgetCache
+
+    cache: ByteBudgetCache[str] = ByteBudgetCache(max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.set("c", b"cccc")
+    assert cache.get("b") is None
+    assert (cache.evictions, len(cache), cache.bytes) == (1, 2, 8)
+    cache.set("huge", b"x" * 11)
+    assert cache.get("huge") is None and cache.bytes == 8
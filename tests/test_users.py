@@ -52,3 +52,52 @@ async def test_get_user_by_id_admin(client: AsyncClient, admin_user, admin_heade
     resp = await client.get(f"/api/v1/users/{test_user.id}", headers=admin_headers)
     assert resp.status_code == 200
     assert resp.json()["email"] == "test@example.com"
+
+
+@pytest.mark.asyncio
+async def test_update_me_invalidates_cached_principal(
+    client: AsyncClient, test_user, auth_headers
+):
+    await client.get("/api/v1/users/me", headers=auth_headers)
+    await client.patch(
+        "/api/v1/users/me", headers=auth_headers, json={"display_name": "Renamed"}
+    )
+    resp = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert resp.json()["display_name"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_deactivation_takes_effect_immediately(
+    client: AsyncClient, admin_user, admin_headers, test_user, auth_headers
+):
+    resp = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert resp.status_code == 200
+
+    resp = await client.patch(
+        f"/api/v1/users/{test_user.id}", headers=admin_headers, json={"is_active": False}
+    )
+    assert resp.status_code == 200
+
+    resp = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_principal_cache(
+    client: AsyncClient, test_user, auth_headers
+):
+    from fasttrack.auth.principals import principal_cache
+
+    await client.get("/api/v1/users/me", headers=auth_headers)
+    resp = await client.get("/api/v1/users/me", headers=auth_headers)
+    assert resp.json()["email"] == "test@example.com"
+    assert principal_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_user_fields_allowlist(client: AsyncClient, admin_user, admin_headers, test_user):
+    resp = await client.get("/api/v1/users?fields=email,id", headers=admin_headers)
+    assert resp.status_code == 200
+    assert all(list(item) == ["id", "email"] for item in resp.json()["items"])
+    resp = await client.get("/api/v1/users?fields=hashed_password", headers=admin_headers)
+    assert resp.status_code == 400